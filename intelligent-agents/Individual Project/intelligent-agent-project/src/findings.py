@@ -0,0 +1,123 @@
+"""
+Findings Container for Email Forensics System
+
+List of findings that indexes them by severity and by (finding type,
+severity) as they are added.
+
+Design Rationale: Indexing on insert chosen because:
+1. Reports list findings most severe first; per-severity buckets make
+   that a concatenation, linear in the number of findings, instead of a
+   sort with a key function evaluated per finding
+2. Statistics, dashboards and report summaries ask for severity and type
+   counts repeatedly; counters kept during append() answer in O(1) rather
+   than rescanning every finding per request
+3. The extra cost is one list slot and two dictionary increments per
+   finding, paid once during analysis
+
+FindingsCollection is a list subclass, so it can stand in wherever a list
+of findings was used: every list operation behaves as usual. append() and
+extend() update the index incrementally; operations that reorder or remove
+findings (insert, remove, sort, slicing assignment, ...) rebuild it. Only
+the severity and finding_type attributes are read; Finding and FindingGroup
+objects (agent.py) both qualify.
+"""
+
+from collections import Counter
+from itertools import chain
+from typing import Dict, Iterable, Iterator, List
+
+
+# Reporting priority: most severe first
+SEVERITY_ORDER = ('High', 'Medium', 'Low')
+
+
+def _reindexing(method):
+    """Wrap a list mutator so the severity / type index is rebuilt after it."""
+    def mutate(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._reindex()
+        return result
+    mutate.__name__ = method.__name__
+    mutate.__doc__ = method.__doc__
+    return mutate
+
+
+class FindingsCollection(list):
+    """
+    List of findings with severity buckets and incremental counts.
+
+    - iteration / indexing / count(x) / +: exactly as for a list
+    - by_severity(): High, Medium, Low, then any other label, each in
+      list order
+    - count_severity() / severity_counts() / type_counts(): maintained on
+      append
+    """
+
+    def __init__(self, findings: Iterable = ()):
+        super().__init__()
+        self._reindex()
+        self.extend(findings)
+
+    def _reindex(self):
+        self._buckets: Dict[str, list] = {severity: [] for severity in SEVERITY_ORDER}
+        self._type_counts = Counter()
+        for finding in self:
+            self._index(finding)
+
+    def _index(self, finding):
+        severity = finding.severity
+        bucket = self._buckets.get(severity)
+        if bucket is None:
+            bucket = self._buckets[severity] = []
+        bucket.append(finding)
+        self._type_counts[(finding.finding_type, severity)] += 1
+
+    def append(self, finding):
+        super().append(finding)
+        self._index(finding)
+
+    def extend(self, findings: Iterable):
+        append = self.append
+        for finding in findings:
+            append(finding)
+
+    def __iadd__(self, findings: Iterable):
+        self.extend(findings)
+        return self
+
+    insert = _reindexing(list.insert)
+    remove = _reindexing(list.remove)
+    pop = _reindexing(list.pop)
+    clear = _reindexing(list.clear)
+    sort = _reindexing(list.sort)
+    reverse = _reindexing(list.reverse)
+    __setitem__ = _reindexing(list.__setitem__)
+    __delitem__ = _reindexing(list.__delitem__)
+    __imul__ = _reindexing(list.__imul__)
+
+    def __reduce__(self):
+        # Rebuild through __init__ so the index exists before items arrive
+        return (type(self), (list(self),))
+
+    def __repr__(self) -> str:
+        return f"FindingsCollection({list.__repr__(self)})"
+
+    def by_severity(self) -> Iterator:
+        """Findings most severe first, list order within a severity."""
+        return chain.from_iterable(self._buckets.values())
+
+    def count_severity(self, severity: str) -> int:
+        """Number of findings with the given severity."""
+        return len(self._buckets.get(severity, ()))
+
+    def severity_counts(self) -> Dict[str, int]:
+        """Finding count per severity label (zero for unused standard labels)."""
+        return {severity: len(bucket) for severity, bucket in self._buckets.items()}
+
+    def type_counts(self) -> Counter:
+        """Finding count per (finding type, severity)."""
+        return Counter(self._type_counts)
+
+    def to_list(self) -> List:
+        """Plain list copy in list order."""
+        return list(self)
@@ -0,0 +1,145 @@
+"""
+Evidence Manifest for Incremental Re-analysis
+
+Persistent record of every evidence file already processed, so repeated
+scans of a growing case folder only parse new or modified files.
+
+Design Rationale: Manifest keyed by (path, mtime, size, SHA-256) because:
+1. Case folders are re-scanned nightly and almost every file is unchanged;
+   re-parsing them repeats work whose result is already known
+2. mtime + size is a stat() away and settles the common case without
+   reading the file; the content hash is only computed when they differ,
+   so a touched-but-identical file (copied, restored from backup) is still
+   recognised
+3. Storing the hash also documents evidence integrity between runs, in
+   line with chain-of-custody practice (NIST SP 800-86, 2006)
+
+The manifest stores plain JSON records and knows nothing about SimpleEmail;
+DiscoveryAgent converts between records and emails, keeping this module
+free of agent dependencies. Records hold the location of a body rather
+than its text wherever it can be re-read from the evidence file, so the
+manifest does not duplicate the case, and entries for files that no
+longer exist are dropped on save.
+
+References:
+- Kent, K. et al. (2006). NIST SP 800-86: Guide to Integrating Forensic
+  Techniques into Incident Response
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+
+
+# Bumped whenever the record layout changes; older manifests are discarded
+MANIFEST_VERSION = 2
+
+
+def file_digest(file_path: str, block_size: int = 1024 * 1024) -> str:
+    """
+    SHA-256 of a file, read in fixed-size blocks to bound memory.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class EvidenceManifest:
+    """
+    JSON-backed cache of parsed email records per evidence file.
+
+    Usage: lookup() before parsing a file; on a miss, parse it and hand the
+    records to record(). save() writes the manifest atomically.
+
+    Entries are only recorded when the file's stat() is unchanged between
+    lookup() and record(), so a file modified while it was being parsed is
+    never cached with stale content.
+    """
+
+    def __init__(self, path: str):
+        """
+        Load the manifest at path, starting empty if it is missing,
+        unreadable or from an older layout.
+        """
+        self.path = path
+        self.files: Dict[str, dict] = {}
+        self.hits = 0
+        self.misses = 0
+        self._observed: Dict[str, Tuple[int, int]] = {}
+        self._dirty = False
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get('version') == MANIFEST_VERSION:
+                self.files = data.get('files', {})
+        except (OSError, ValueError):
+            # Corrupt or absent manifest only costs a full re-parse
+            pass
+
+    def lookup(self, file_path: str) -> Optional[List[dict]]:
+        """
+        Return cached records for an unchanged file, or None.
+
+        A matching mtime and size is trusted directly; otherwise the content
+        hash decides, and a hash match refreshes the stored stat so the
+        next run takes the fast path again.
+        """
+        stat = os.stat(file_path)
+        observed = (stat.st_mtime_ns, stat.st_size)
+        self._observed[file_path] = observed
+        entry = self.files.get(file_path)
+        if entry is not None:
+            if (entry['mtime_ns'], entry['size']) == observed:
+                self.hits += 1
+                return entry['records']
+            if entry['size'] == stat.st_size and entry['sha256'] == file_digest(file_path):
+                entry['mtime_ns'] = stat.st_mtime_ns
+                self._dirty = True
+                self.hits += 1
+                return entry['records']
+        self.misses += 1
+        return None
+
+    def record(self, file_path: str, records: List[dict]) -> bool:
+        """
+        Cache the parsed records of a file previously passed to lookup().
+
+        Returns False (and caches nothing) if the file changed since lookup.
+        """
+        observed = self._observed.pop(file_path, None)
+        stat = os.stat(file_path)
+        if observed != (stat.st_mtime_ns, stat.st_size):
+            return False
+        self.files[file_path] = {
+            'mtime_ns': stat.st_mtime_ns,
+            'size': stat.st_size,
+            'sha256': file_digest(file_path),
+            'records': records
+        }
+        self._dirty = True
+        return True
+
+    def save(self):
+        """
+        Write the manifest if anything changed, first dropping entries for
+        files that have been deleted or moved.
+
+        Written to a temporary file and renamed into place so an interrupted
+        run never leaves a truncated manifest behind.
+        """
+        removed = [path for path in self.files if not os.path.isfile(path)]
+        for path in removed:
+            del self.files[path]
+            self._dirty = True
+        if not self._dirty:
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': MANIFEST_VERSION, 'files': self.files}, f)
+        os.replace(temp_path, self.path)
+        self._dirty = False
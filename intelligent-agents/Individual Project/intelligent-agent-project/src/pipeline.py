@@ -0,0 +1,265 @@
+"""
+Concurrent Pipeline for Email Forensics System
+
+asyncio orchestration of the analysis pipeline: discovery streams parsed
+emails through a bounded queue into AnalysisAgent's incremental session,
+then dashboard, reports and UML documentation run concurrently - the
+dashboard in a render process, the others in worker threads. Every stage
+is timed.
+
+Design Rationale: Staged event-driven pipeline chosen because:
+1. Discovery is dominated by file reads and parsing, analysis by rule
+   evaluation; connected by a queue the two overlap instead of analysis
+   waiting for the last file (Welsh et al., 2001)
+2. The queue is bounded, so when analysis falls behind discovery blocks
+   rather than buffering the evidence set in memory (backpressure)
+3. Once findings exist, visualization, reporting and documentation depend
+   on nothing but them; run side by side, the output phase takes as long
+   as its slowest stage (usually the dashboard) rather than the sum
+4. The event loop alone touches the queue and analysis state, so no locks
+   are needed; blocking work is handed to executors
+5. pyplot is neither thread-safe nor safe to switch backends in mid-run,
+   so the Agg backend is selected once on the main thread before any
+   stage starts, and charts are drawn in a separate process that receives
+   only the DashboardSummary. That process is spawned rather than forked,
+   because forking a process that runs threads can copy locks held by
+   them and deadlock the child; its own render pool (render_workers) is
+   then forked from a single-threaded process
+
+Worker threads share the interpreter lock, so the overlap comes from file
+I/O, compression (which release it) and from the render process. The
+sequential main.run_email_forensics_system() remains the reference
+pipeline.
+
+References:
+- Welsh, M., Culler, D., & Brewer, E. (2001). SEDA: An Architecture for
+  Well-Conditioned, Scalable Internet Services. SOSP
+- Hohpe, G., & Woolf, B. (2003). Enterprise Integration Patterns:
+  Pipes and Filters. Addison-Wesley
+"""
+
+import asyncio
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+import matplotlib
+
+import charts
+from agent import AnalysisAgent, DashboardAgent, DiscoveryAgent, ReportAgent
+from findings import FindingsCollection
+from summary import DashboardSummary
+from utils import generate_uml_documentation
+
+
+# Emails per queue item
+# Rationale: One queue hand-off per email would cost more than analysing it
+BATCH_SIZE = 256
+
+# Batches buffered between discovery and analysis before discovery waits
+QUEUE_BATCHES = 8
+
+# End-of-stream marker on the discovery queue
+_DONE = object()
+
+
+class StageTimings:
+    """
+    Seconds spent per pipeline stage, in the order stages finish.
+
+    Stages timed with stage() record wall-clock time; add() accumulates
+    busy time for stages that run in slices (analysis between batches).
+    """
+
+    def __init__(self):
+        self.stages: Dict[str, float] = {}
+        self._started = time.perf_counter()
+        self.total = None
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def add(self, name: str, seconds: float):
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def finish(self) -> float:
+        """Freeze and return end-to-end time since construction."""
+        self.total = time.perf_counter() - self._started
+        return self.total
+
+    def as_dict(self) -> Dict[str, float]:
+        timings = dict(self.stages)
+        if self.total is not None:
+            timings['total'] = self.total
+        return timings
+
+
+async def stream_analysis(discovery_agent: DiscoveryAgent, analysis_agent: AnalysisAgent,
+                          timings: StageTimings, batch_size: int = BATCH_SIZE,
+                          queue_batches: int = QUEUE_BATCHES,
+                          executor: Optional[Executor] = None) -> FindingsCollection:
+    """
+    Discovery streamed into analysis through a bounded queue.
+
+    Parsing runs in an executor thread and hands batches to the event
+    loop; each batch is analysed on arrival (AnalysisAgent.observe), and
+    cross-email findings are added once discovery ends. Records
+    "discovery" (wall time of the parsing thread) and "analysis" (time
+    spent analysing) in timings. A discovery error is re-raised here.
+    """
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue(maxsize=queue_batches)
+    stopped = threading.Event()
+
+    def put(batch):
+        # Blocks the parsing thread while the queue is full
+        asyncio.run_coroutine_threadsafe(queue.put(batch), loop).result()
+
+    def produce():
+        with timings.stage("discovery"):
+            batch = []
+            for email in discovery_agent.iter_emails():
+                if stopped.is_set():
+                    return
+                batch.append(email)
+                if len(batch) >= batch_size:
+                    put(batch)
+                    batch = []
+            if batch:
+                put(batch)
+
+    async def producer():
+        try:
+            await loop.run_in_executor(executor, produce)
+        finally:
+            await queue.put(_DONE)
+
+    producing = asyncio.ensure_future(producer())
+    analysis_agent.begin()
+    try:
+        while True:
+            batch = await queue.get()
+            if batch is _DONE:
+                break
+            start = time.perf_counter()
+            analysis_agent.observe(batch)
+            timings.add("analysis", time.perf_counter() - start)
+    except BaseException:
+        # Let the parsing thread finish so the executor can shut down
+        stopped.set()
+        while await queue.get() is not _DONE:
+            pass
+        await asyncio.gather(producing, return_exceptions=True)
+        raise
+    await producing
+
+    start = time.perf_counter()
+    findings = analysis_agent.end()
+    timings.add("analysis", time.perf_counter() - start)
+    return findings
+
+
+def _render_dashboard(summary: DashboardSummary, workers: int, cache_dir: Optional[str],
+                      profile: charts.RenderProfile) -> Tuple[List[str], List[str]]:
+    """
+    Render-process task: the dashboard from its summary alone.
+
+    Module-level so it can be pickled to the render process. Returns the
+    chart paths rendered and reused, as DashboardAgent records them.
+    """
+    charts.init_render_worker()
+    dashboard_agent = DashboardAgent(None, None, workers=workers, summary=summary,
+                                     cache_dir=cache_dir, profile=profile)
+    dashboard_agent.generate_dashboard()
+    return dashboard_agent.rendered, dashboard_agent.reused
+
+
+async def run_output_stages(dashboard_agent: DashboardAgent, report_agent: ReportAgent,
+                            timings: StageTimings,
+                            render_executor: Optional[Executor] = None) -> dict:
+    """
+    Dashboard, reports and UML documentation concurrently.
+
+    The dashboard summary is aggregated here, on the event loop thread,
+    and rendered in render_executor (default: one spawned process);
+    reports and documentation run in threads. Each stage is timed
+    separately ("visualization", "reporting", "documentation"). Returns
+    the UML paths; the first stage error is re-raised once every stage
+    has stopped.
+    """
+    loop = asyncio.get_running_loop()
+    summary = dashboard_agent.summary
+    cache_dir = dashboard_agent.render_cache.directory if dashboard_agent.render_cache else None
+    renderer = render_executor or ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+    try:
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="output") as pool:
+            async def stage(name, executor, func, *args):
+                with timings.stage(name):
+                    return await loop.run_in_executor(executor, func, *args)
+
+            results = await asyncio.gather(
+                stage("visualization", renderer, _render_dashboard, summary,
+                      dashboard_agent.workers, cache_dir, dashboard_agent.profile),
+                stage("reporting", pool, report_agent.generate_comprehensive_report),
+                stage("documentation", pool, generate_uml_documentation),
+                return_exceptions=True)
+    finally:
+        if render_executor is None:
+            renderer.shutdown()
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    dashboard_agent.rendered, dashboard_agent.reused = results[0]
+    return results[2]
+
+
+async def run_pipeline(search_directory: str = "output/emails", manifest_path: str = None,
+                       render_profile: str = "publication", render_workers: int = 1,
+                       cache_dir: Optional[str] = "output/.render_cache",
+                       batch_size: int = BATCH_SIZE, queue_batches: int = QUEUE_BATCHES,
+                       timings: StageTimings = None) -> dict:
+    """
+    Discovery through documentation for an existing evidence directory.
+
+    Returns the agents' results in the shape of
+    main.run_email_forensics_system(), plus the StageTimings (pass one in
+    to include stages timed before this call).
+    """
+    timings = timings if timings is not None else StageTimings()
+    # Before any stage starts a thread: switching backends later is not
+    # safe while other threads may be using matplotlib
+    matplotlib.use('Agg')
+    discovery_agent = DiscoveryAgent(search_directory, manifest_path=manifest_path)
+    analysis_agent = AnalysisAgent([])
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="discovery") as reader:
+        findings = await stream_analysis(discovery_agent, analysis_agent, timings,
+                                         batch_size, queue_batches, reader)
+    emails = analysis_agent.emails
+    stats = analysis_agent.get_statistics()
+
+    dashboard_agent = DashboardAgent(emails, findings, workers=render_workers,
+                                     cache_dir=cache_dir, profile=render_profile,
+                                     arrays=analysis_agent.get_email_arrays())
+    report_agent = ReportAgent(emails, findings, arrays=analysis_agent.get_email_arrays())
+    uml_paths = await run_output_stages(dashboard_agent, report_agent, timings)
+    timings.finish()
+    return {
+        'emails': emails,
+        'findings': findings,
+        'statistics': stats,
+        'report_paths': {
+            'text': report_agent.text_report_path,
+            'html': 'output/reports/forensics_report.html'
+        },
+        'uml_paths': uml_paths,
+        'timings': timings
+    }
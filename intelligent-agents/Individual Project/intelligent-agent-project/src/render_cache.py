@@ -0,0 +1,132 @@
+"""
+Render Output Cache for Email Forensics System
+
+Content-addressed disk cache for dashboard charts. Each rendered PNG is
+stored under a digest of the chart's aggregated input data and the
+rendering style, so a chart whose inputs have not changed is never drawn
+again.
+
+Design Rationale: Keyed on inputs rather than on email files because:
+1. Charts render from small aggregates (see summary.py); adding a few
+   emails to a case typically changes some aggregates (timeline, counts)
+   and leaves others identical (severity mix, top domain paths)
+2. Hashing a few kilobytes of aggregate data costs microseconds, while
+   rendering a chart at print resolution costs seconds
+3. Style settings (render profile, word cloud layout, library version)
+   are part of the key, so restyled or preview dashboards never reuse
+   images of another quality
+
+Blobs are evicted least-recently-used first once the cache exceeds its
+byte budget; an index records which key each output file currently holds,
+so an unchanged chart is skipped without even copying.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from typing import Callable, Dict, Sequence
+
+import charts
+
+
+# Default byte budget for cached images (a full dashboard is a few MB)
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class RenderCache:
+    """
+    LRU, size-bounded store of rendered chart images.
+
+    Usage per chart: key() -> is_current() / restore() on a hit, or render
+    then store() on a miss. save() persists the output index.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._index_path = os.path.join(directory, "index.json")
+        os.makedirs(directory, exist_ok=True)
+        try:
+            with open(self._index_path, 'r', encoding='utf-8') as f:
+                self.index: Dict[str, str] = json.load(f)
+        except (OSError, ValueError):
+            self.index = {}
+
+    def key(self, render: Callable, args: Sequence,
+            profile: charts.RenderProfile = charts.PUBLICATION) -> str:
+        """
+        Digest of renderer identity, input data, render profile and current
+        style settings.
+        """
+        payload = json.dumps([render.__module__, render.__qualname__, list(args),
+                              charts.style_fingerprint(profile)],
+                             sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def is_current(self, path: str, key: str) -> bool:
+        """
+        True if the output file already holds the image for key.
+        """
+        if self.index.get(os.path.abspath(path)) != key or not os.path.exists(path):
+            return False
+        self._touch(key)
+        return True
+
+    def restore(self, key: str, path: str) -> bool:
+        """
+        Copy a cached image to path; False if key is not cached.
+        """
+        blob = self._blob(key)
+        if not os.path.exists(blob):
+            return False
+        shutil.copyfile(blob, path)
+        self._touch(key)
+        self.index[os.path.abspath(path)] = key
+        return True
+
+    def store(self, key: str, path: str):
+        """
+        Cache a freshly rendered image, then enforce the byte budget.
+        """
+        if not os.path.exists(path):
+            return  # Nothing was written (e.g. rendering disabled)
+        shutil.copyfile(path, self._blob(key))
+        self.index[os.path.abspath(path)] = key
+        self._evict(keep=key)
+
+    def save(self):
+        """Persist the output index."""
+        with open(self._index_path, 'w', encoding='utf-8') as f:
+            json.dump(self.index, f)
+
+    def _blob(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.png")
+
+    def _touch(self, key: str):
+        # mtime doubles as last-use time for LRU eviction
+        try:
+            os.utime(self._blob(key))
+        except OSError:
+            pass
+
+    def _evict(self, keep: str):
+        """
+        Delete least recently used blobs until within max_bytes.
+
+        The blob just stored is kept even if it alone exceeds the budget.
+        """
+        blobs = []
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(".png"):
+                    stat = entry.stat()
+                    blobs.append((stat.st_mtime_ns, stat.st_size, entry.path, entry.name[:-4]))
+        total = sum(size for _, size, _, _ in blobs)
+        for _, size, blob, key in sorted(blobs):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            os.remove(blob)
+            total -= size
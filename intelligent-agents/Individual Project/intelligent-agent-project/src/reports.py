@@ -0,0 +1,257 @@
+"""
+Report Writers for Email Forensics System
+
+Streaming output for ReportAgent: report sections and findings are
+written to a buffered (optionally gzip-compressed) file handle as they are
+produced, rather than assembled into one string first. HTML reports come
+from Jinja2 templates in src/templates/.
+
+Design Rationale: Streaming chosen because:
+1. Building the report with repeated string concatenation copies the
+   whole report once per finding - quadratic in the number of findings
+2. Holding the finished report in memory costs as much RAM as the file
+   itself; a 2M-finding case reaches gigabytes before a byte is written
+3. Writes are grouped into chunks of formatted findings, so per-call
+   overhead stays low for both plain files and gzip streams (Deutsch, 1996)
+4. HTML templates are compiled once into a shared Environment, with
+   compiled bytecode cached on disk for later processes; rendering then
+   streams template output instead of building the page in memory
+   (Ronacher, 2008)
+5. Large cases are paginated: the main HTML report holds counts per
+   finding type and severity plus links to fixed-size finding pages, so
+   no single file a browser opens grows with the number of findings
+
+Like charts.py and summary.py, this module reads only plain attributes
+(finding_type, severity, email_id, description, timestamp) and does not
+import the agents.
+
+References:
+- Deutsch, P. (1996). GZIP file format specification version 4.3.
+  RFC 1952
+- Ronacher, A. (2008). Jinja2 Documentation: API - Bytecode Cache.
+  Pallets Projects
+"""
+
+import glob
+import gzip
+import io
+import os
+from collections import Counter
+from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+from typing import Iterator, List, Sequence, TextIO
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, select_autoescape
+
+from findings import SEVERITY_ORDER
+
+
+# Write buffer for plain report files
+BUFFER_SIZE = 1024 * 1024
+
+# Findings formatted per write() call
+# Rationale: Amortises call and compression overhead without holding more
+# than a few hundred kilobytes of text at once
+FINDINGS_PER_WRITE = 1024
+
+
+# Report templates shipped with the source
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+
+# Template output buffered per write() while streaming
+TEMPLATE_CHUNK = 64
+
+# Findings per HTML page; cases with more findings are paginated
+# Rationale: A few hundred cards render instantly in any browser
+FINDINGS_PER_PAGE = 500
+
+# Page files, relative to the HTML report
+PAGE_DIR = "findings"
+
+
+@lru_cache(maxsize=None)
+def template_environment() -> Environment:
+    """
+    Shared Jinja2 environment, created on first use.
+
+    - Templates compiled once per process and kept in the environment cache
+    - FileSystemBytecodeCache (per-user temp directory) lets later runs and
+      batch worker processes skip compilation entirely
+    - auto_reload off: no per-render stat of the template file
+    - Autoescaping for .html, since findings quote email subjects and
+      addresses controlled by the sender
+    """
+    return Environment(loader=FileSystemLoader(TEMPLATE_DIR),
+                       bytecode_cache=FileSystemBytecodeCache(),
+                       auto_reload=False,
+                       autoescape=select_autoescape(['html']))
+
+
+def open_report(path: str, compress: bool = False) -> TextIO:
+    """
+    Open a UTF-8 text report for writing, gzip-compressed if requested.
+    """
+    if compress:
+        return io.TextIOWrapper(gzip.open(path, 'wb'), encoding='utf-8')
+    return open(path, 'w', encoding='utf-8', buffering=BUFFER_SIZE)
+
+
+def by_severity(findings: Sequence) -> Iterator:
+    """
+    Findings most severe first, in detection order within a severity.
+
+    A findings.FindingsCollection is already bucketed by severity; other
+    sequences are walked once per severity level instead of sorted, so no
+    reordered copy of a large findings list is built.
+    """
+    if hasattr(findings, 'by_severity'):
+        yield from findings.by_severity()
+        return
+    for severity in SEVERITY_ORDER:
+        for finding in findings:
+            if finding.severity == severity:
+                yield finding
+
+
+def finding_groups(findings: Sequence) -> List[dict]:
+    """
+    Finding counts per (finding type, severity), most severe first, then
+    most frequent.
+    """
+    if hasattr(findings, 'type_counts'):
+        counts = findings.type_counts()
+    else:
+        counts = Counter((finding.finding_type, finding.severity) for finding in findings)
+    rank = {severity: i for i, severity in enumerate(SEVERITY_ORDER)}
+    return [{'finding_type': finding_type, 'severity': severity, 'count': count}
+            for (finding_type, severity), count
+            in sorted(counts.items(), key=lambda item: (rank.get(item[0][1], len(rank)), -item[1]))]
+
+
+def _format_finding(finding) -> str:
+    return f"""
+Finding: {finding.finding_type}
+Severity: {finding.severity}
+Email ID: {finding.email_id}
+Description: {finding.description}
+Timestamp: {finding.timestamp.strftime('%Y-%m-%d %H:%M:%S')}
+{'='*50}
+"""
+
+
+def write_text_report(handle: TextIO, stats: dict, findings: Sequence,
+                      generated: datetime = None):
+    """
+    Write the plain text report to an open handle.
+
+    Structure: executive summary, severity breakdown, then every finding
+    in by_severity() order.
+    """
+    generated = generated or datetime.now()
+    # Report structure: Executive summary → statistics → detailed findings
+    # Rationale: Pyramid structure (most important first) for busy readers
+    handle.write(f"""
+EMAIL FORENSICS ANALYSIS REPORT
+================================
+Generated: {generated.strftime('%Y-%m-%d %H:%M:%S')}
+
+EXECUTIVE SUMMARY
+-----------------
+Total Emails Analyzed: {stats['total_emails']}
+Suspicious Emails: {stats['suspicious_emails']} ({stats['suspicious_emails']/stats['total_emails']*100:.1f}%)
+External Communications: {stats['external_emails']}
+After-Hours Communications: {stats['after_hours_emails']}
+Total Security Findings: {stats['total_findings']}
+
+FINDINGS BREAKDOWN
+------------------
+High Severity: {stats['high_severity_findings']}
+Medium Severity: {stats['medium_severity_findings']}
+Low Severity: {stats['low_severity_findings']}
+
+DETAILED FINDINGS
+-----------------
+""")
+
+    chunk = []
+    for finding in by_severity(findings):
+        chunk.append(_format_finding(finding))
+        if len(chunk) >= FINDINGS_PER_WRITE:
+            handle.write(''.join(chunk))
+            chunk.clear()
+    if chunk:
+        handle.write(''.join(chunk))
+
+
+def write_html_report(handle: TextIO, stats: dict, findings: Sequence,
+                      generated: datetime = None, pages: Sequence[dict] = None):
+    """
+    Stream the HTML report (templates/forensics_report.html) to a handle.
+
+    Findings are summarised by type and severity. With pages (see
+    write_finding_pages) the report links to them; otherwise every finding
+    is listed inline. Either way findings follow by_severity() order, so
+    the listing does not depend on whether the case was paginated.
+    Embedded CSS keeps the report self-contained.
+    """
+    generated = generated or datetime.now()
+    _dump("forensics_report.html", handle,
+          stats=stats,
+          groups=finding_groups(findings),
+          findings=() if pages else list(by_severity(findings)),
+          pages=pages,
+          timestamp=generated.strftime('%Y-%m-%d %H:%M:%S'))
+
+
+def write_finding_pages(report_dir: str, findings: Sequence,
+                        page_size: int = FINDINGS_PER_PAGE,
+                        generated: datetime = None) -> List[dict]:
+    """
+    Write findings as numbered HTML pages under report_dir/findings/.
+
+    Pages follow by_severity() order and link to their neighbours and the
+    main report. Pages left over from an earlier, larger run are removed.
+    Returns one dict per page (number, href, first, last, severities) for
+    the report index.
+    """
+    generated = generated or datetime.now()
+    page_dir = os.path.join(report_dir, PAGE_DIR)
+    os.makedirs(page_dir, exist_ok=True)
+    for stale in glob.glob(os.path.join(page_dir, "page_*.html")):
+        os.remove(stale)
+
+    page_count = (len(findings) + page_size - 1) // page_size
+    name = "page_{:05d}.html".format
+    ordered = by_severity(findings)
+    pages = []
+    for number in range(1, page_count + 1):
+        chunk = list(islice(ordered, page_size))
+        first = (number - 1) * page_size + 1
+        page = {
+            'number': number,
+            'href': f"{PAGE_DIR}/{name(number)}",
+            'first': first,
+            'last': first + len(chunk) - 1,
+            'severities': ", ".join(f"{count} {severity}" for severity, count
+                                    in Counter(finding.severity for finding in chunk).items())
+        }
+        with open(os.path.join(page_dir, name(number)), 'w', encoding='utf-8',
+                  buffering=BUFFER_SIZE) as f:
+            _dump("findings_page.html", f,
+                  page=page,
+                  page_count=page_count,
+                  findings=chunk,
+                  previous_href=name(number - 1),
+                  next_href=name(number + 1),
+                  index_href="../forensics_report.html",
+                  timestamp=generated.strftime('%Y-%m-%d %H:%M:%S'))
+        pages.append(page)
+    return pages
+
+
+def _dump(template_name: str, handle: TextIO, **context):
+    """Stream a template to an open handle in TEMPLATE_CHUNK pieces."""
+    stream = template_environment().get_template(template_name).stream(**context)
+    stream.enable_buffering(TEMPLATE_CHUNK)
+    stream.dump(handle)
@@ -0,0 +1,309 @@
+"""
+Detection Rules for Email Forensics System
+
+This module holds the rule definitions shared by the data model and the
+agents: the suspicious keyword vocabulary, the matching engine that scans
+email text against it, and the per-email feature record derived from the
+active rule configuration.
+
+Design Rationale: Rules separated from agent.py because:
+1. Several agents apply the same rules; one definition avoids drift
+   between detection, statistics and reporting
+2. Rule sets change more often than agent logic (new phishing campaigns
+   bring new vocabulary) and should be editable in one place
+3. The matching engine can be tested and tuned independently
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import FrozenSet, Iterable, List, NamedTuple, Set, Tuple, Union
+
+
+# Default vocabulary for content-based detection
+# Rationale: Terms drawn from APWG phishing trend reports (2023) covering
+# urgency, financial lures and social engineering hooks
+SUSPICIOUS_KEYWORDS = (
+    'confidential', 'secret', 'critical', 'account', 'payment', 'transfer',
+    'urgent', 'immediate', 'verify', 'suspend', 'click here', 'download',
+    'invoice', 'refund', 'winner', 'congratulations', 'inheritance',
+    'million', 'dollars', 'bitcoin', 'cryptocurrency', 'phishing'
+)
+
+# Subset of keywords that escalate a subject line to High severity
+# Rationale: Time pressure is the primary phishing indicator (APWG, 2023)
+HIGH_URGENCY_KEYWORDS = ('urgent', 'critical', 'suspend')
+
+
+class KeywordMatch(NamedTuple):
+    """
+    Single keyword occurrence within scanned text.
+
+    Position recorded so callers can tell which field a match came from
+    (subject vs. body) and so analysts can locate the evidence quickly.
+    """
+    keyword: str
+    start: int
+
+
+class KeywordMatcher:
+    """
+    Multi-pattern keyword matcher compiled once from a keyword set.
+
+    Design Rationale: Keywords compiled into a single trie-shaped regex
+    (shared prefixes factored out, e.g. "c(?:lick here|on(?:fidential|...)))")
+    rather than one substring scan per keyword because:
+    1. Performance - the text is walked once regardless of vocabulary size,
+       and the factored pattern rejects non-matching positions after one
+       character comparison, behaving like an Aho-Corasick automaton without
+       a third-party dependency
+    2. Explainability - reports which keywords matched and where, so each
+       alert is traceable to concrete evidence
+    3. Maintainability - the vocabulary stays a plain tuple; compilation is
+       automatic
+
+    Text is lowercased before scanning because case-insensitive regex
+    matching is several times slower in CPython's re engine. Matching is
+    substring-based (no word boundaries) and overlapping, preserving the
+    original "keyword in text" semantics: the pattern is a lookahead, so it
+    is tried at every position, and the longest keyword found there also
+    implies every keyword that is a prefix of it ("dollarsuspend" reports
+    both "dollars" and "suspend").
+    """
+
+    def __init__(self, keywords: Iterable[str] = SUSPICIOUS_KEYWORDS):
+        """
+        Compile the matcher for the given keyword set.
+
+        Keywords are normalised to lowercase and de-duplicated, preserving
+        order, so reported matches are canonical.
+        """
+        self.keywords = tuple(dict.fromkeys(word.lower() for word in keywords if word))
+        self._pattern = None
+        self._bytes_pattern = None
+        self._search_pattern = None
+        # Keywords matched at a position, keyed by the longest one there:
+        # itself plus every keyword that is a prefix of it, shortest first
+        self._implied = {word: tuple(other for other in sorted(self.keywords, key=len)
+                                     if word.startswith(other))
+                         for word in self.keywords}
+        if self.keywords:
+            source = _trie_pattern(self.keywords)
+            self._search_pattern = re.compile(source)
+            # Zero-width lookahead: finditer tries every position, so
+            # overlapping occurrences are all found
+            overlapping = f'(?=({source}))'
+            self._pattern = re.compile(overlapping)
+            # Byte-level twin for scanning undecoded message bodies in place
+            self._bytes_pattern = re.compile(overlapping.encode('utf-8'))
+
+    def scan(self, text: str) -> List[KeywordMatch]:
+        """
+        Return every keyword occurrence in text, in order of position.
+
+        Positions refer to the lowercased text, which for ASCII input is
+        identical to the original.
+        """
+        if self._pattern is None or not text:
+            return []
+        implied = self._implied
+        return [KeywordMatch(keyword, match.start())
+                for match in self._pattern.finditer(text.lower())
+                for keyword in implied[match.group(1)]]
+
+    def scan_bytes(self, data: bytes) -> List[KeywordMatch]:
+        """
+        Scan raw (undecoded) bytes, e.g. a body view into a mapped mailbox.
+
+        Avoids building a str for text that analysis only needs to search.
+        Case folding is ASCII-only and positions are byte offsets; keywords
+        are matched by their UTF-8 encoding.
+        """
+        if self._bytes_pattern is None or not data:
+            return []
+        implied = self._implied
+        return [KeywordMatch(keyword, match.start())
+                for match in self._bytes_pattern.finditer(data.lower())
+                for keyword in implied[match.group(1).decode('utf-8')]]
+
+    def matched_keywords(self, text: str) -> Set[str]:
+        """
+        Return the distinct set of keywords present in text.
+        """
+        return {match.keyword for match in self.scan(text)}
+
+    def search(self, text: str) -> bool:
+        """
+        Return True if any keyword occurs in text (stops at first hit).
+        """
+        if self._search_pattern is None or not text:
+            return False
+        return self._search_pattern.search(text.lower()) is not None
+
+
+class KeywordScan(NamedTuple):
+    """
+    Result of scanning an email's subject and body in one pass.
+
+    Subject and content are joined with a single space (as the original
+    detection did) and scanned once; subject_end marks the boundary so
+    subject-only rules such as severity escalation need no second scan.
+    """
+    matches: Tuple[KeywordMatch, ...]
+    subject_end: int
+
+    def keywords(self) -> Set[str]:
+        """Distinct keywords found anywhere in the email."""
+        return {match.keyword for match in self.matches}
+
+    def subject_keywords(self) -> Set[str]:
+        """Distinct keywords found in the subject line only."""
+        return {match.keyword for match in self.matches
+                if match.start + len(match.keyword) <= self.subject_end}
+
+
+def scan_email_text(subject: str, content: Union[str, bytes],
+                    matcher: KeywordMatcher = None) -> KeywordScan:
+    """
+    Scan subject and content together with a single matcher pass.
+
+    content may be raw bytes from a lazily loaded body; the subject is then
+    scanned separately and body match positions shifted past the boundary.
+    """
+    matcher = matcher or _active_config.matcher
+    subject_end = len(subject.lower())
+    if isinstance(content, (bytes, bytearray, memoryview)):
+        body_start = subject_end + 1
+        matches = matcher.scan(subject) + [
+            KeywordMatch(match.keyword, match.start + body_start)
+            for match in matcher.scan_bytes(bytes(content))]
+    else:
+        matches = matcher.scan(subject + " " + content)
+    return KeywordScan(tuple(matches), subject_end)
+
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """
+    Build a regex source string with common prefixes factored into a trie.
+
+    Example: ("secret", "suspend") -> "s(?:ecret|uspend)"
+    """
+    trie: dict = {}
+    for word in keywords:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}  # End-of-word marker
+
+    def build(node: dict) -> str:
+        branches = [re.escape(char) + build(child)
+                    for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if '' in node:
+            # A keyword ends here but longer ones continue; optional suffix
+            # is greedy so the longest keyword is reported
+            return f'(?:{body})?'
+        return body
+
+    return build(trie)
+
+
+@dataclass(frozen=True)
+class RuleConfig:
+    """
+    Complete configuration of the per-email detection rules.
+
+    Design Rationale: Frozen dataclass so a configuration can never change
+    underneath cached results. "Changing the rules" means installing a new
+    RuleConfig object via set_rule_config(); feature caches compare the
+    config they were computed with by identity and recompute on mismatch.
+    This makes invalidation O(1) with no registry of cached emails.
+
+    Defaults reproduce the original hardcoded rules: 8 AM - 6 PM business
+    hours and company.com / internal.org as internal domains.
+    """
+    suspicious_keywords: Tuple[str, ...] = SUSPICIOUS_KEYWORDS
+    high_urgency_keywords: Tuple[str, ...] = HIGH_URGENCY_KEYWORDS
+    internal_domains: Tuple[str, ...] = ('company.com', 'internal.org')
+    business_hours: Tuple[int, int] = (8, 18)
+    matcher: KeywordMatcher = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Normalise vocabularies to match the matcher's lowercase output
+        for name in ('suspicious_keywords', 'high_urgency_keywords'):
+            object.__setattr__(self, name, tuple(value.lower() for value in getattr(self, name)))
+        # Matcher compiled once per configuration, covering both vocabularies
+        # so one scan serves suspicion and severity rules
+        object.__setattr__(self, 'matcher', KeywordMatcher(
+            self.suspicious_keywords + self.high_urgency_keywords))
+
+    def fingerprint(self) -> str:
+        """
+        Stable digest of the rule settings.
+
+        Identifies the configuration across processes and runs (identity
+        only works within one), e.g. for features stored in a manifest.
+        """
+        return hashlib.sha256(repr(self).encode('utf-8')).hexdigest()[:16]
+
+
+class EmailFeatures(NamedTuple):
+    """
+    Memoized rule evaluation results for a single email.
+
+    Computed once per email per RuleConfig and read by every agent, so the
+    keyword scan, domain split and hour comparison are never repeated for
+    the same email within a run.
+    """
+    suspicious: bool
+    high_urgency: bool
+    after_hours: bool
+    external: bool
+    keywords: FrozenSet[str]
+    sender_domain: str
+
+
+_active_config = RuleConfig()
+
+
+def get_rule_config() -> RuleConfig:
+    """Return the rule configuration currently in force."""
+    return _active_config
+
+
+def set_rule_config(config: RuleConfig) -> RuleConfig:
+    """
+    Install a new rule configuration and return the previous one.
+
+    Cached EmailFeatures computed under the old configuration become stale
+    automatically and are recomputed on next access.
+    """
+    global _active_config
+    previous, _active_config = _active_config, config
+    return previous
+
+
+def compute_features(subject: str, content: Union[str, bytes], sender: str, date: datetime,
+                     config: RuleConfig = None) -> EmailFeatures:
+    """
+    Evaluate every per-email rule in one go.
+
+    Takes plain field values rather than an email object so the rules stay
+    independent of the data model (avoids a circular import with agent.py).
+    """
+    config = config or _active_config
+    scan = scan_email_text(subject, content, config.matcher)
+    keywords = frozenset(scan.keywords())
+    start_hour, end_hour = config.business_hours
+    sender_domain = sender.split('@')[-1] if '@' in sender else ''
+    return EmailFeatures(
+        suspicious=not keywords.isdisjoint(config.suspicious_keywords),
+        high_urgency=not scan.subject_keywords().isdisjoint(config.high_urgency_keywords),
+        after_hours=date.hour < start_hour or date.hour > end_hour,
+        external=sender_domain not in config.internal_domains,
+        keywords=keywords,
+        sender_domain=sender_domain
+    )
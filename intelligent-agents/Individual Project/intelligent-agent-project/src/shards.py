@@ -0,0 +1,181 @@
+"""
+Sharded Analysis for Email Forensics System
+
+Map/reduce execution of discovery and analysis: evidence files are split
+into shards by a stable hash of their path, each worker parses and
+analyses one shard, and the workers' partial results are merged into a
+single AnalysisAgent (see AnalysisAgent.partial() / merge()).
+
+Design Rationale: Partition by file and merge partial results because:
+1. Parsing and rule evaluation are independent per file, so shards need
+   no communication until the reduce step (Dean & Ghemawat, 2004)
+2. Workers ship findings, statistics columns and strategy states - a few
+   bytes per email plus sketches - never the emails themselves
+3. Cross-email rules are concluded only after merging: burst detection
+   receives every timestamp and volume analysis a merged Space-Saving
+   sketch, so findings do not depend on how files were split
+4. Hashing relative paths (CRC-32) assigns a file to the same shard on any
+   host and in any process, without a coordinator or a shared file list
+
+Workers can run:
+- locally, in a process pool (run_sharded)
+- as separate processes or hosts sharing the evidence directory, writing
+  partials to a shared filesystem (--output) or sending them to a reducer
+  over an authenticated socket (--send, multiprocessing.connection)
+
+Every worker and the reducer must use the same strategy configuration and
+rule configuration.
+
+References:
+- Dean, J., & Ghemawat, S. (2004). MapReduce: Simplified Data Processing
+  on Large Clusters. OSDI
+"""
+
+import argparse
+import copy
+import os
+import pickle
+import sys
+import zlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
+from multiprocessing.connection import Client, Listener
+from typing import Iterable, List, Optional, Tuple
+
+from agent import AnalysisAgent, AnalysisPartial, AnalysisStrategy, DiscoveryAgent
+
+
+# Environment variable holding the socket authentication key
+AUTHKEY_ENV = "FORENSICS_SHARD_KEY"
+
+
+def shard_of(file_path: str, search_directory: str, shard_count: int) -> int:
+    """Shard index of an evidence file, stable across hosts and runs."""
+    relative = os.path.relpath(file_path, search_directory).replace(os.sep, "/")
+    return zlib.crc32(relative.encode("utf-8")) % shard_count
+
+
+def analyze_shard(search_directory: str, shard_index: int, shard_count: int,
+                  recursive: bool = False, strategies: List[AnalysisStrategy] = None,
+                  aggregate: bool = False) -> AnalysisPartial:
+    """
+    Map step: discover, parse and analyse one shard of the evidence.
+
+    strategies are copied, so one list can be passed to every worker.
+    """
+    if not 0 <= shard_index < shard_count:
+        raise ValueError(f"shard index {shard_index} outside 0..{shard_count - 1}")
+    discovery_agent = DiscoveryAgent(search_directory, recursive=recursive)
+    paths = [path for path in discovery_agent.iter_email_files()
+             if shard_of(path, search_directory, shard_count) == shard_index]
+    analysis_agent = AnalysisAgent([], copy.deepcopy(strategies), aggregate)
+    analysis_agent.begin(retain=False)
+    analysis_agent.observe(discovery_agent.iter_emails(paths))
+    return analysis_agent.partial()
+
+
+def run_sharded(search_directory: str = "output/emails", shards: Optional[int] = None,
+                recursive: bool = False, strategies: List[AnalysisStrategy] = None,
+                aggregate: bool = False, executor: str = "process") -> AnalysisAgent:
+    """
+    Analyse the evidence in shards on local workers and merge the results.
+
+    shards: number of shards and workers (None = every available core);
+    executor: "process" (default) or "thread".
+    """
+    shards = shards or os.cpu_count() or 1
+    pool_class = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+    with pool_class(max_workers=shards) as pool:
+        partials = list(pool.map(analyze_shard, repeat(search_directory), range(shards),
+                                 repeat(shards), repeat(recursive), repeat(strategies),
+                                 repeat(aggregate)))
+    return AnalysisAgent.merge(partials, strategies, aggregate)
+
+
+def write_partial(partial: AnalysisPartial, path: str):
+    """
+    Save a partial for a reducer on a shared filesystem.
+
+    Written under a temporary name and renamed, so a reducer never reads a
+    partial that is still being written.
+    """
+    temporary = f"{path}.tmp{os.getpid()}"
+    with open(temporary, 'wb') as f:
+        pickle.dump(partial, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temporary, path)
+
+
+def read_partial(path: str) -> AnalysisPartial:
+    """Load a partial written by write_partial() (trusted workers only)."""
+    with open(path, 'rb') as f:
+        return pickle.load(f)
+
+
+def send_partial(partial: AnalysisPartial, address: Tuple[str, int], authkey: bytes):
+    """Send a partial to a reducer listening with receive_partials()."""
+    with Client(address, authkey=authkey) as connection:
+        connection.send(partial)
+
+
+def receive_partials(address: Tuple[str, int], count: int, authkey: bytes) -> List[AnalysisPartial]:
+    """
+    Accept count worker connections and collect one partial from each.
+
+    Connections are authenticated with authkey (HMAC challenge) before any
+    data is unpickled.
+    """
+    partials = []
+    with Listener(address, authkey=authkey) as listener:
+        while len(partials) < count:
+            with listener.accept() as connection:
+                partials.append(connection.recv())
+    return partials
+
+
+def merge_partial_files(paths: Iterable[str], strategies: List[AnalysisStrategy] = None,
+                        aggregate: bool = False) -> AnalysisAgent:
+    """Reduce step for partials collected on a shared filesystem."""
+    return AnalysisAgent.merge((read_partial(path) for path in paths), strategies, aggregate)
+
+
+def _address(text: str) -> Tuple[str, int]:
+    host, _, port = text.rpartition(":")
+    return host or "localhost", int(port)
+
+
+def main(argv: List[str] = None) -> int:
+    """
+    Worker command line: analyse one shard and hand the partial on.
+
+        python shards.py EVIDENCE_DIR --shard 0 --of 4 --output shard0.pkl
+        python shards.py EVIDENCE_DIR --shard 0 --of 4 --send reducer:6000
+
+    --send reads the authentication key from the FORENSICS_SHARD_KEY
+    environment variable.
+    """
+    parser = argparse.ArgumentParser(description="Analyse one shard of an evidence directory")
+    parser.add_argument("directory")
+    parser.add_argument("--shard", type=int, required=True, help="shard index (from 0)")
+    parser.add_argument("--of", type=int, required=True, dest="shard_count", help="number of shards")
+    parser.add_argument("--recursive", action="store_true")
+    parser.add_argument("--aggregate", action="store_true")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--output", help="write the partial to this file")
+    target.add_argument("--send", type=_address, metavar="HOST:PORT",
+                        help="send the partial to a reducer")
+    args = parser.parse_args(argv)
+
+    partial = analyze_shard(args.directory, args.shard, args.shard_count,
+                            recursive=args.recursive, aggregate=args.aggregate)
+    if args.output:
+        write_partial(partial, args.output)
+    else:
+        authkey = os.environ.get(AUTHKEY_ENV)
+        if not authkey:
+            parser.error(f"--send requires the {AUTHKEY_ENV} environment variable")
+        send_partial(partial, args.send, authkey.encode("utf-8"))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+"""
+Vectorised Statistics Backend for Email Forensics System
+
+Computes the summary counters and activity histograms used by the
+analysis, dashboard and report stages from compact NumPy arrays instead of
+per-object Python loops.
+
+Design Rationale: Array-based statistics chosen because:
+1. Statistics are requested several times per run (console summary,
+   dashboard, both reports); each request previously re-walked emails and
+   findings calling Python methods per item
+2. Once per-email rule results exist as boolean / int8 columns, every
+   counter is a single C-level reduction (count_nonzero, bincount) taking
+   milliseconds even over millions of rows (van der Walt et al., 2011)
+3. The arrays are small (a few bytes per email) and can be built either
+   during the analysis pass or zero-copy from a columnar EmailStore
+
+This module depends only on NumPy and plain attributes (features(), date,
+severity), keeping it free of agent imports.
+
+References:
+- van der Walt, S., Colbert, S. C., & Varoquaux, G. (2011). The NumPy
+  Array: A Structure for Efficient Numerical Computation. Computing in
+  Science & Engineering, 13(2)
+"""
+
+from array import array
+from typing import Iterable, Sequence
+
+import numpy as np
+
+
+# Integer codes for finding severities; unknown labels map to -1
+SEVERITY_CODES = {"Low": 0, "Medium": 1, "High": 2}
+
+
+class EmailArrays:
+    """
+    Per-email statistics columns.
+
+    - suspicious / external / after_hours: bool arrays
+    - hours: int8 wall-clock hour (0-23) of each email's date
+    - weekdays: int8 day of week (Monday = 0)
+    """
+    __slots__ = ('suspicious', 'external', 'after_hours', 'hours', 'weekdays')
+
+    def __init__(self, suspicious, external, after_hours, hours, weekdays):
+        self.suspicious = np.asarray(suspicious, dtype=bool)
+        self.external = np.asarray(external, dtype=bool)
+        self.after_hours = np.asarray(after_hours, dtype=bool)
+        self.hours = np.asarray(hours, dtype=np.int8)
+        self.weekdays = np.asarray(weekdays, dtype=np.int8)
+
+    def __len__(self) -> int:
+        return len(self.suspicious)
+
+    @classmethod
+    def from_emails(cls, emails: Iterable) -> 'EmailArrays':
+        """
+        Build the columns with one pass over emails (cached features are reused).
+        """
+        builder = EmailArraysBuilder()
+        add = builder.add
+        for email in emails:
+            add(email.features(), email.date)
+        return builder.build()
+
+    @classmethod
+    def concat(cls, parts: Sequence['EmailArrays']) -> 'EmailArrays':
+        """
+        Columns of several email sets back to back (e.g. merged shards).
+        """
+        if not parts:
+            return EmailArraysBuilder().build()
+        return cls(*(np.concatenate([getattr(part, name) for part in parts])
+                     for name in cls.__slots__))
+
+
+class EmailArraysBuilder:
+    """
+    Incremental construction of EmailArrays, one email at a time.
+
+    Typed arrays grow amortised O(1) per append and are wrapped by NumPy
+    without copying at build time, so an analysis pass can collect the
+    columns as a side effect.
+    """
+
+    def __init__(self):
+        self.flags = array('b')
+        self.hours = array('b')
+        self.weekdays = array('b')
+
+    def add(self, features, date):
+        """Record one email's rule flags and timestamp."""
+        self.flags.append(features.suspicious | (features.external << 1) | (features.after_hours << 2))
+        self.hours.append(date.hour)
+        self.weekdays.append(date.weekday())
+
+    def __len__(self) -> int:
+        return len(self.hours)
+
+    def build(self, copy: bool = False) -> EmailArrays:
+        """
+        Wrap the collected columns. Without copy the typed arrays are shared
+        and must not grow afterwards; copy=True snapshots them so collection
+        can continue (incremental analysis).
+        """
+        convert = np.array if copy else np.frombuffer
+        flags = convert(self.flags, dtype=np.int8)
+        return EmailArrays((flags & 1) != 0, (flags & 2) != 0, (flags & 4) != 0,
+                           convert(self.hours, dtype=np.int8),
+                           convert(self.weekdays, dtype=np.int8))
+
+
+def severity_codes(findings: Sequence) -> np.ndarray:
+    """
+    int8 severity code per finding (see SEVERITY_CODES).
+    """
+    return np.fromiter((SEVERITY_CODES.get(finding.severity, -1) for finding in findings),
+                       dtype=np.int8, count=len(findings))
+
+
+def severity_totals(findings: Sequence) -> np.ndarray:
+    """
+    Finding counts indexed by severity code.
+
+    A findings.FindingsCollection already keeps these counts, so they are
+    read in O(1); any other sequence is encoded and counted with bincount.
+    """
+    if hasattr(findings, 'severity_counts'):
+        counts = findings.severity_counts()
+        totals = np.zeros(len(SEVERITY_CODES), dtype=np.intp)
+        for severity, code in SEVERITY_CODES.items():
+            totals[code] = counts.get(severity, 0)
+        return totals
+    codes = severity_codes(findings)
+    return np.bincount(codes[codes >= 0], minlength=len(SEVERITY_CODES))
+
+
+def summarize(arrays: EmailArrays, by_severity: np.ndarray, total_findings: int) -> dict:
+    """
+    Every statistics counter from array reductions.
+
+    by_severity holds finding counts indexed by severity code (see
+    severity_totals). Keys and meaning match AnalysisAgent.get_statistics();
+    values are plain ints so the result stays JSON-serialisable.
+    """
+    return {
+        "total_emails": len(arrays),
+        "suspicious_emails": int(np.count_nonzero(arrays.suspicious)),
+        "external_emails": int(np.count_nonzero(arrays.external)),
+        "after_hours_emails": int(np.count_nonzero(arrays.after_hours)),
+        "total_findings": total_findings,
+        "high_severity_findings": int(by_severity[SEVERITY_CODES["High"]]),
+        "medium_severity_findings": int(by_severity[SEVERITY_CODES["Medium"]]),
+        "low_severity_findings": int(by_severity[SEVERITY_CODES["Low"]])
+    }
+
+
+def histograms(arrays: EmailArrays) -> dict:
+    """
+    Activity histograms: emails per hour, per weekday, and per
+    (weekday, hour) cell as a 7x24 matrix.
+    """
+    hours = arrays.hours.astype(np.intp)
+    weekdays = arrays.weekdays.astype(np.intp)
+    return {
+        "hourly": np.bincount(hours, minlength=24),
+        "weekday": np.bincount(weekdays, minlength=7),
+        "weekday_hour": np.bincount(weekdays * 24 + hours, minlength=7 * 24).reshape(7, 24)
+    }
@@ -0,0 +1,422 @@
+"""
+Columnar Email Store for Email Forensics System
+
+Compact in-memory representation of a loaded evidence set. Emails are held
+column by column (typed arrays and interned string tables) instead of as
+one SimpleEmail object each, and handed out as lightweight views that
+behave like SimpleEmail for the agents.
+
+Design Rationale: Columnar layout chosen over a list of dataclasses because:
+1. Per-object overhead dominates at scale - every SimpleEmail carries an
+   instance __dict__, a full datetime object and its own copies of sender,
+   recipient and path strings; a million emails costs gigabytes
+2. Forensic corpora are highly repetitive: a few thousand addresses,
+   domains and source files account for millions of messages, so interning
+   them as integer IDs stores each distinct value once
+3. Typed arrays (array module) store dates and flags at 1-8 bytes per
+   email and can be wrapped zero-copy by NumPy for vectorised statistics
+   (Abadi et al., 2013 on column-store efficiency)
+
+Content is kept only when it cannot be re-read from the evidence file;
+otherwise it is reloaded from the source on access, since analysis works
+from cached rule features and only display needs the body.
+
+References:
+- Abadi, D. et al. (2013). The Design and Implementation of Modern
+  Column-Oriented Database Systems. Foundations and Trends in Databases
+"""
+
+import os
+from array import array
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, Iterator, Optional
+
+import numpy as np
+
+# Import SimpleEmail from agent module
+# Design Note: store builds on the data model, so it depends on agent.py
+# and not the other way round (agent.py only imports it lazily)
+import sys
+sys.path.insert(0, os.path.dirname(__file__))
+from agent import DiscoveryAgent, SimpleEmail, parse_email_file
+from parsers import ContentRef, mbox_message_ref, parse_eml
+from stats import EmailArrays
+from rules import EmailFeatures, KeywordScan, compute_features, get_rule_config, scan_email_text
+
+
+# Reference point for date columns; naive dates are stored as if UTC
+_EPOCH = datetime(1970, 1, 1)
+
+# utc_offset column value for naive (timezone-unaware) dates
+NAIVE_OFFSET = -32768
+
+# Bit layout of the per-email rule flags column
+_SUSPICIOUS, _HIGH_URGENCY, _AFTER_HOURS, _EXTERNAL = 1, 2, 4, 8
+
+
+class InternTable:
+    """
+    Bidirectional mapping between distinct values and dense integer IDs.
+
+    Values are stored once; columns hold the 4-byte ID instead. Works for
+    any hashable value (strings, keyword frozensets).
+    """
+    __slots__ = ('values', '_ids')
+
+    def __init__(self):
+        self.values = []
+        self._ids = {}
+
+    def intern(self, value) -> int:
+        """Return the ID of value, adding it if unseen."""
+        value_id = self._ids.get(value)
+        if value_id is None:
+            value_id = self._ids[value] = len(self.values)
+            self.values.append(value)
+        return value_id
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+
+class EmailStore:
+    """
+    Column-oriented collection of emails with SimpleEmail-compatible views.
+
+    Columns (one entry per email):
+    - ids, subject/sender/recipient/domain/path IDs into intern tables
+    - epoch_seconds (int64), microseconds (int32) and utc_offsets (int16,
+      minutes; NAIVE_OFFSET for naive dates) - together they rebuild the
+      original datetime, including its wall-clock hour
+    - source offsets/lengths (int64; -1 length for "whole file")
+    - rule flags (one byte) and keyword-set IDs, valid for one RuleConfig
+    - contents: the body, a ContentRef, or None when it is re-read from
+      the evidence file on access
+
+    The store is Sized, indexable and re-iterable, so AnalysisAgent,
+    DashboardAgent and ReportAgent accept it wherever they accept a list.
+    """
+
+    def __init__(self, emails: Iterable = (), lazy_content: bool = True):
+        """
+        Build a store, optionally filling it from an iterable of emails.
+
+        lazy_content: drop bodies that can be re-read from their evidence
+        file. Assumes evidence files are not modified while the store is
+        alive, as forensic sources should not be.
+        """
+        self.lazy_content = lazy_content
+        self.ids = []
+        self.subjects = InternTable()
+        self.addresses = InternTable()
+        self.domains = InternTable()
+        self.paths = InternTable()
+        self.keyword_sets = InternTable()
+        self.subject_ids = array('i')
+        self.sender_ids = array('i')
+        self.recipient_ids = array('i')
+        self.domain_ids = array('i')
+        self.path_ids = array('i')
+        self.epoch_seconds = array('q')
+        self.microseconds = array('i')
+        self.utc_offsets = array('h')
+        self.source_offsets = array('q')
+        self.source_lengths = array('q')
+        self.flags = bytearray()
+        self.keyword_ids = array('i')
+        self.contents = []
+        # Which paths can have their content re-read, per path ID
+        self._reloadable = bytearray()
+        # Rule features are valid per email for this config only
+        self._features_config = None
+        self._features_valid = bytearray()
+        self._timezones = {}
+        self.extend(emails)
+
+    def append(self, email):
+        """
+        Add one email (a SimpleEmail or any object with the same fields).
+
+        Rule features already cached on the email under the active rules
+        are copied into the columns rather than recomputed.
+        """
+        path_id = self.paths.intern(email.file_path)
+        if path_id == len(self._reloadable):
+            self._reloadable.append(self._is_reloadable(email.file_path))
+
+        seconds, micros, offset = self._encode_date(email.date)
+        self.ids.append(email.id)
+        self.subject_ids.append(self.subjects.intern(email.subject))
+        self.sender_ids.append(self.addresses.intern(email.sender))
+        self.recipient_ids.append(self.addresses.intern(email.recipient))
+        self.path_ids.append(path_id)
+        self.epoch_seconds.append(seconds)
+        self.microseconds.append(micros)
+        self.utc_offsets.append(offset)
+        self.source_offsets.append(getattr(email, 'source_offset', 0))
+        length = getattr(email, 'source_length', None)
+        self.source_lengths.append(-1 if length is None else length)
+
+        content = email.__dict__.get('_content') if isinstance(email, SimpleEmail) else email.content
+        if self.lazy_content and self._reloadable[path_id] and not isinstance(content, ContentRef):
+            content = None
+        self.contents.append(content)
+
+        self.flags.append(0)
+        self.keyword_ids.append(0)
+        self.domain_ids.append(0)
+        self._features_valid.append(0)
+        cached = getattr(email, '_features', None)
+        config = get_rule_config()
+        if cached is not None and getattr(email, '_features_config', None) is config:
+            if self._features_config is not config:
+                self._reset_features(config)
+            self._store_features(len(self.ids) - 1, cached)
+
+    def extend(self, emails: Iterable):
+        """Append every email from an iterable (consumed once)."""
+        for email in emails:
+            self.append(email)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self) -> Iterator['EmailView']:
+        for index in range(len(self.ids)):
+            yield EmailView(self, index)
+
+    def __getitem__(self, index: int) -> 'EmailView':
+        if index < 0:
+            index += len(self.ids)
+        if not 0 <= index < len(self.ids):
+            raise IndexError("EmailStore index out of range")
+        return EmailView(self, index)
+
+    # -- Column decoding -------------------------------------------------
+
+    def date(self, index: int) -> datetime:
+        """Rebuild the datetime of one email."""
+        value = _EPOCH + timedelta(seconds=self.epoch_seconds[index],
+                                   microseconds=self.microseconds[index])
+        offset = self.utc_offsets[index]
+        if offset == NAIVE_OFFSET:
+            return value
+        tz = self._timezones.get(offset)
+        if tz is None:
+            tz = self._timezones[offset] = timezone(timedelta(minutes=offset))
+        return (value + timedelta(minutes=offset)).replace(tzinfo=tz)
+
+    def content(self, index: int) -> str:
+        """Body text of one email, re-read from its source if not held."""
+        content = self.contents[index]
+        if isinstance(content, ContentRef):
+            return content.text()
+        if content is None:
+            return _reload_content(self.paths.values[self.path_ids[index]],
+                                   self.source_offsets[index], self.source_lengths[index])
+        return content
+
+    def email(self, index: int) -> SimpleEmail:
+        """Materialise one email as a standalone SimpleEmail."""
+        return SimpleEmail(
+            id=self.ids[index],
+            subject=self.subjects.values[self.subject_ids[index]],
+            sender=self.addresses.values[self.sender_ids[index]],
+            recipient=self.addresses.values[self.recipient_ids[index]],
+            date=self.date(index),
+            content=self.contents[index] if self.contents[index] is not None else self.content(index),
+            file_path=self.paths.values[self.path_ids[index]],
+            source_offset=self.source_offsets[index],
+            source_length=None if self.source_lengths[index] < 0 else self.source_lengths[index]
+        )
+
+    # -- Rule features ---------------------------------------------------
+
+    def features(self, index: int) -> EmailFeatures:
+        """
+        Rule features of one email, computed on first use per RuleConfig.
+
+        Installing a different RuleConfig invalidates every row at once.
+        """
+        config = get_rule_config()
+        if self._features_config is not config:
+            self._reset_features(config)
+        if not self._features_valid[index]:
+            content = self.contents[index]
+            if isinstance(content, ContentRef) and content.raw() is not None:
+                content = content.raw()
+            else:
+                content = self.content(index)
+            self._store_features(index, compute_features(
+                self.subjects.values[self.subject_ids[index]], content,
+                self.addresses.values[self.sender_ids[index]], self.date(index), config))
+        flags = self.flags[index]
+        return EmailFeatures(
+            suspicious=bool(flags & _SUSPICIOUS),
+            high_urgency=bool(flags & _HIGH_URGENCY),
+            after_hours=bool(flags & _AFTER_HOURS),
+            external=bool(flags & _EXTERNAL),
+            keywords=self.keyword_sets.values[self.keyword_ids[index]],
+            sender_domain=self.domains.values[self.domain_ids[index]]
+        )
+
+    def statistics_arrays(self) -> EmailArrays:
+        """
+        Statistics columns derived from the store without per-email objects.
+
+        Rule flags are unpacked from the flag byte and hours / weekdays are
+        computed from the epoch columns with vectorised integer arithmetic
+        (applying each date's own UTC offset, as datetime.hour would).
+        Missing rule features are computed first.
+        """
+        config = get_rule_config()
+        if self._features_config is not config:
+            self._reset_features(config)
+        index = self._features_valid.find(0)
+        while index != -1:
+            self.features(index)
+            index = self._features_valid.find(0, index + 1)
+
+        flags = np.frombuffer(self.flags, dtype=np.uint8)
+        offsets = np.frombuffer(self.utc_offsets, dtype=np.int16).astype(np.int64)
+        wall = np.frombuffer(self.epoch_seconds, dtype=np.int64) + np.where(
+            offsets == NAIVE_OFFSET, 0, offsets * 60)
+        # 1970-01-01 was a Thursday (weekday 3)
+        return EmailArrays((flags & _SUSPICIOUS) != 0, (flags & _EXTERNAL) != 0,
+                           (flags & _AFTER_HOURS) != 0, (wall // 3600) % 24,
+                           (wall // 86400 + 3) % 7)
+
+    def _store_features(self, index: int, features: EmailFeatures):
+        self.flags[index] = ((_SUSPICIOUS if features.suspicious else 0)
+                             | (_HIGH_URGENCY if features.high_urgency else 0)
+                             | (_AFTER_HOURS if features.after_hours else 0)
+                             | (_EXTERNAL if features.external else 0))
+        self.keyword_ids[index] = self.keyword_sets.intern(frozenset(features.keywords))
+        self.domain_ids[index] = self.domains.intern(features.sender_domain)
+        self._features_valid[index] = 1
+
+    def _reset_features(self, config):
+        self._features_config = config
+        self._features_valid = bytearray(len(self.ids))
+
+    # -- Helpers ---------------------------------------------------------
+
+    @staticmethod
+    def _encode_date(date: datetime):
+        """
+        Split a datetime into (epoch seconds, microseconds, utc offset).
+
+        Aware dates store true UTC seconds plus their offset in minutes
+        (sub-minute offsets are not preserved); naive dates are stored as
+        if they were UTC.
+        """
+        offset = date.utcoffset()
+        if offset is None:
+            delta = date - _EPOCH
+            minutes = NAIVE_OFFSET
+        else:
+            delta = date.replace(tzinfo=None) - offset - _EPOCH
+            minutes = int(offset.total_seconds() // 60)
+        return delta.days * 86400 + delta.seconds, delta.microseconds, minutes
+
+    @staticmethod
+    def _is_reloadable(file_path: str) -> bool:
+        return (os.path.splitext(file_path)[1].lower() in DiscoveryAgent.SUPPORTED_EXTENSIONS
+                and os.path.isfile(file_path))
+
+
+class EmailView:
+    """
+    Read-only, SimpleEmail-compatible handle on one row of an EmailStore.
+
+    Two slots (store, index) instead of a full object; fields are decoded
+    from the columns on access. Use to_email() for a mutable copy.
+    """
+    __slots__ = ('_store', '_index')
+
+    def __init__(self, store: EmailStore, index: int):
+        self._store = store
+        self._index = index
+
+    @property
+    def id(self) -> str:
+        return self._store.ids[self._index]
+
+    @property
+    def subject(self) -> str:
+        store = self._store
+        return store.subjects.values[store.subject_ids[self._index]]
+
+    @property
+    def sender(self) -> str:
+        store = self._store
+        return store.addresses.values[store.sender_ids[self._index]]
+
+    @property
+    def recipient(self) -> str:
+        store = self._store
+        return store.addresses.values[store.recipient_ids[self._index]]
+
+    @property
+    def date(self) -> datetime:
+        return self._store.date(self._index)
+
+    @property
+    def content(self) -> str:
+        return self._store.content(self._index)
+
+    @property
+    def file_path(self) -> str:
+        store = self._store
+        return store.paths.values[store.path_ids[self._index]]
+
+    @property
+    def source_offset(self) -> int:
+        return self._store.source_offsets[self._index]
+
+    @property
+    def source_length(self) -> Optional[int]:
+        length = self._store.source_lengths[self._index]
+        return None if length < 0 else length
+
+    def features(self) -> EmailFeatures:
+        return self._store.features(self._index)
+
+    def keyword_scan(self) -> KeywordScan:
+        return scan_email_text(self.subject, self.content, get_rule_config().matcher)
+
+    def is_suspicious(self) -> bool:
+        return self.features().suspicious
+
+    def is_after_hours(self) -> bool:
+        return self.features().after_hours
+
+    def is_external(self) -> bool:
+        return self.features().external
+
+    def to_email(self) -> SimpleEmail:
+        return self._store.email(self._index)
+
+    def __eq__(self, other):
+        if isinstance(other, EmailView):
+            other = other.to_email()
+        if not isinstance(other, SimpleEmail):
+            return NotImplemented
+        return self.to_email() == other
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"EmailView(id={self.id!r}, subject={self.subject!r}, sender={self.sender!r})"
+
+
+def _reload_content(file_path: str, offset: int, length: int) -> str:
+    """
+    Re-read one email body from its evidence file.
+    """
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension == ".mbox":
+        return mbox_message_ref(file_path, offset, length).text()
+    if extension == ".eml":
+        return parse_eml(file_path).content
+    return parse_email_file(file_path).content
@@ -0,0 +1,136 @@
+"""
+Dashboard Summary for Email Forensics System
+
+Aggregate-first data layer for the dashboard: the analysis statistics
+columns plus one pass over the emails produce every chart's input, stored
+as a small serialisable record that charts render from.
+
+Design Rationale: Aggregation separated from rendering because:
+1. Each chart used to walk the full email list again (hours, dates,
+   day-hour matrix, domain pairs, subjects); one fused pass replaces
+   eight, so dashboard cost stops multiplying with chart count
+2. The summary is a few kilobytes regardless of case size, so it can be
+   saved next to the case and dashboards re-rendered or restyled later
+   without reloading or re-analysing the evidence
+3. Render workers receive the summary rather than emails, keeping
+   inter-process transfer constant (see charts.py)
+4. Counters and hour / weekday histograms are NumPy reductions over the
+   columns the analysis pass already collected (stats.py), so the email
+   pass only gathers what the columns do not hold
+
+Only plain attributes (features(), date, subject, sender, recipient,
+severity) are read, so any email collection works, including an EmailStore.
+"""
+
+import json
+from collections import Counter
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from charts import subject_terms
+from stats import EmailArrays, EmailArraysBuilder, histograms, severity_totals, summarize
+
+
+# Communication paths kept in the summary; the chart shows the top 10
+# Rationale: Headroom for re-rendering with a larger top-N later
+DOMAIN_PATH_LIMIT = 50
+
+
+def _domain(address: str) -> str:
+    return address.split('@')[-1] if '@' in address else address
+
+
+@dataclass
+class DashboardSummary:
+    """
+    Pre-aggregated inputs for every dashboard chart.
+
+    All fields are JSON types: counts, lists and string-keyed dicts. Dates
+    are ISO strings so the record round-trips through save()/load().
+    """
+    total_emails: int = 0
+    suspicious_emails: int = 0
+    external_emails: int = 0
+    after_hours_emails: int = 0
+    total_findings: int = 0
+    # Finding counts in Low, Medium, High order
+    severity_counts: List[int] = field(default_factory=lambda: [0, 0, 0])
+    hour_counts: List[int] = field(default_factory=lambda: [0] * 24)
+    # 7x24 matrix, Monday first
+    weekday_hour_counts: List[List[int]] = field(default_factory=lambda: [[0] * 24 for _ in range(7)])
+    # (ISO date, count) pairs in date order
+    daily_counts: List[Tuple[str, int]] = field(default_factory=list)
+    # ((sender domain, recipient domain), count), most frequent first
+    domain_paths: List[Tuple[Tuple[str, str], int]] = field(default_factory=list)
+    # Word cloud term frequencies derived from all subjects
+    subject_terms: Dict[str, float] = field(default_factory=dict)
+
+    @classmethod
+    def from_data(cls, emails: Iterable, findings: Sequence,
+                  arrays: Optional[EmailArrays] = None) -> 'DashboardSummary':
+        """
+        Aggregate every chart input.
+
+        Email counters and the hour / weekday histograms come from the
+        statistics columns: arrays (e.g. AnalysisAgent.get_email_arrays()
+        for the same emails), an EmailStore's own columns, or otherwise
+        columns collected during the single pass over the emails that
+        gathers days, domain pairs and subjects.
+        """
+        if arrays is None and hasattr(emails, 'statistics_arrays'):
+            arrays = emails.statistics_arrays()
+        builder = EmailArraysBuilder() if arrays is None else None
+        days = Counter()
+        paths = Counter()
+        subjects = []
+
+        for email in emails:
+            date = email.date
+            if builder is not None:
+                builder.add(email.features(), date)
+            days[date.date()] += 1
+            paths[(_domain(email.sender), _domain(email.recipient))] += 1
+            subjects.append(email.subject)
+
+        if builder is not None:
+            arrays = builder.build()
+        counts = summarize(arrays, severity_totals(findings), len(findings))
+        activity = histograms(arrays)
+        summary = cls(
+            total_emails=counts['total_emails'],
+            suspicious_emails=counts['suspicious_emails'],
+            external_emails=counts['external_emails'],
+            after_hours_emails=counts['after_hours_emails'],
+            total_findings=counts['total_findings'],
+            severity_counts=[counts['low_severity_findings'], counts['medium_severity_findings'],
+                             counts['high_severity_findings']],
+            hour_counts=activity['hourly'].tolist(),
+            weekday_hour_counts=activity['weekday_hour'].tolist(),
+            daily_counts=[(day.isoformat(), count) for day, count in sorted(days.items())],
+            domain_paths=paths.most_common(DOMAIN_PATH_LIMIT))
+        if subjects:
+            summary.subject_terms = subject_terms(' '.join(subjects))
+        return summary
+
+    def to_dict(self) -> dict:
+        """Plain-dict form (JSON-serialisable)."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'DashboardSummary':
+        """Rebuild a summary, restoring tuples that JSON turned into lists."""
+        data = dict(data)
+        data['daily_counts'] = [tuple(pair) for pair in data.get('daily_counts', [])]
+        data['domain_paths'] = [(tuple(path), count) for path, count in data.get('domain_paths', [])]
+        return cls(**data)
+
+    def save(self, path: str):
+        """Write the summary as JSON."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path: str) -> 'DashboardSummary':
+        """Read a summary written by save()."""
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
@@ -0,0 +1,225 @@
+"""
+Directory Watchers for Email Forensics System
+
+Report files that finish arriving in an evidence directory, for
+DiscoveryAgent's watch mode: Linux inotify through ctypes, or periodic
+polling wherever inotify is unavailable.
+
+Design Rationale: Kernel notification preferred over polling because:
+1. Mail journaling drops files continuously; inotify wakes the reader as
+   soon as a file is closed, so latency is bounded by parsing rather than
+   by a poll interval (Love, 2005)
+2. Waiting for IN_CLOSE_WRITE / IN_MOVED_TO means files are never read
+   half-written; polling approximates this by requiring a file's size and
+   mtime to stay unchanged across two consecutive scans
+3. ctypes avoids a third-party dependency; polling keeps watch mode
+   working on macOS, Windows and network filesystems that do not deliver
+   inotify events
+
+Watchers only report candidate paths. Filtering by extension, parsing and
+de-duplication are left to the caller (see DiscoveryAgent.watch).
+
+References:
+- Love, R. (2005). Kernel Korner - Intro to inotify. Linux Journal, 139
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+# inotify event masks (linux/inotify.h)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+_WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+_EVENT = struct.Struct("iIII")
+
+# Default polling interval in seconds
+POLL_INTERVAL = 0.5
+
+
+def _visible_dirs(directory: str, recursive: bool) -> List[str]:
+    """The directory plus, if recursive, every non-hidden subdirectory."""
+    directories = [directory]
+    if recursive:
+        for root, subdirs, _ in os.walk(directory):
+            subdirs[:] = [name for name in subdirs if not name.startswith(".")]
+            directories.extend(os.path.join(root, name) for name in subdirs)
+    return directories
+
+
+class InotifyWatcher:
+    """
+    inotify-based watcher (Linux). Raises OSError if inotify is unavailable.
+    """
+
+    def __init__(self, directory: str, recursive: bool = False):
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify requires Linux")
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.directory = directory
+        self.recursive = recursive
+        self._dirs: Dict[int, str] = {}
+        # Set after a queue overflow: events were lost and the caller
+        # should rescan the directory
+        self.overflowed = False
+        try:
+            for path in _visible_dirs(directory, recursive):
+                self._add_watch(path)
+        except OSError:
+            self.close()
+            raise
+
+    def _add_watch(self, path: str):
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), _WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_add_watch failed", path)
+        self._dirs[wd] = path
+
+    def read(self, timeout: Optional[float] = None) -> List[str]:
+        """
+        Paths of files completed since the last call, waiting up to timeout
+        seconds (None waits indefinitely) for the first event.
+        """
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        paths = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT.unpack_from(data, offset)
+            offset += _EVENT.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                self.overflowed = True
+                continue
+            if mask & IN_IGNORED:
+                self._dirs.pop(wd, None)
+                continue
+            directory = self._dirs.get(wd)
+            if directory is None or name.startswith("."):
+                continue
+            path = os.path.join(directory, name)
+            if mask & IN_ISDIR:
+                if self.recursive and mask & (IN_CREATE | IN_MOVED_TO):
+                    # Files may land before the watch exists: report them too
+                    for subdir in _visible_dirs(path, True):
+                        self._add_watch(subdir)
+                        paths.extend(os.path.join(subdir, entry) for entry in os.listdir(subdir)
+                                     if not entry.startswith("."))
+            elif mask & (IN_CLOSE_WRITE | IN_MOVED_TO):
+                paths.append(path)
+        return paths
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class PollingWatcher:
+    """
+    Portable watcher: rescans the directory every interval seconds.
+
+    A file is reported once its (size, mtime) has been identical in two
+    consecutive scans, so files still being written are not reported.
+    Files present when the watcher starts are not reported.
+    """
+
+    def __init__(self, directory: str, recursive: bool = False, interval: float = POLL_INTERVAL):
+        self.directory = directory
+        self.recursive = recursive
+        self.interval = interval
+        self.overflowed = False
+        self._next_scan = time.monotonic() + interval
+        self._reported = self._scan()
+        self._pending: Dict[str, Tuple[int, int]] = {}
+
+    def _scan(self) -> Dict[str, Tuple[int, int]]:
+        snapshot = {}
+        for directory in _visible_dirs(self.directory, self.recursive):
+            try:
+                entries = os.scandir(directory)
+            except OSError:
+                continue  # Removed between listing and scanning
+            with entries:
+                for entry in entries:
+                    if entry.name.startswith(".") or not entry.is_file():
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    snapshot[entry.path] = (stat.st_size, stat.st_mtime_ns)
+        return snapshot
+
+    def read(self, timeout: Optional[float] = None) -> List[str]:
+        """
+        Paths of files that became stable since the last call, after at
+        most one scan; waits for the next scan if it is due within timeout.
+        """
+        wait = max(0.0, self._next_scan - time.monotonic())
+        if timeout is not None and wait > timeout:
+            time.sleep(timeout)
+            return []
+        time.sleep(wait)
+        self._next_scan = time.monotonic() + self.interval
+
+        paths = []
+        pending = {}
+        for path, signature in self._scan().items():
+            if self._reported.get(path) == signature:
+                continue
+            if self._pending.get(path) == signature:
+                self._reported[path] = signature
+                paths.append(path)
+            else:
+                pending[path] = signature
+        self._pending = pending
+        return paths
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def open_watcher(directory: str, recursive: bool = False, poll_interval: float = POLL_INTERVAL,
+                 force_polling: bool = False):
+    """
+    An InotifyWatcher where supported, otherwise a PollingWatcher.
+    """
+    if not force_polling:
+        try:
+            return InotifyWatcher(directory, recursive)
+        except (OSError, AttributeError):
+            pass  # Not Linux, no libc symbol, or watch limit reached
+    return PollingWatcher(directory, recursive, poll_interval)
@@ -24,16 +24,35 @@ References:
 import pytest
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch, MagicMock
+import asyncio
 import tempfile
+import threading
+import time
+import gzip
+import re
 import shutil
+import numpy as np
 
 # Add src directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from agent import SimpleEmail, Finding, DiscoveryAgent, AnalysisAgent, DashboardAgent, ReportAgent
+from agent import AnalysisStrategy, BurstStrategy, VolumeStrategy
 from utils import EnhancedEmailGenerator
+import charts
+import pipeline
+import shards
+import reports
+from store import EmailStore
+from sketches import SpaceSaving
+from stats import summarize
+from summary import DashboardSummary
+from rules import (SUSPICIOUS_KEYWORDS, KeywordMatcher, RuleConfig, compute_features, scan_email_text,
+                   set_rule_config)
 
 
 # =============================================================================
@@ -240,6 +259,136 @@ class TestSimpleEmail:
         assert email.is_external() == True
 
 
+# =============================================================================
+# KEYWORD MATCHER TESTS
+# =============================================================================
+
+class TestKeywordMatcher:
+    """
+    Tests for the shared compiled keyword matching engine.
+    
+    Why test the matcher separately: Every keyword-based rule depends on it.
+    A missed or misattributed match silently changes detection results.
+    """
+    
+    def test_scan_reports_keywords_and_positions(self):
+        """
+        Verify matches carry the canonical keyword and its offset.
+        
+        Why this test: Analysts need to locate the evidence behind a finding;
+        positions must point at the matched text, case-insensitively.
+        """
+        matcher = KeywordMatcher(['urgent', 'click here'])
+        matches = matcher.scan("Please CLICK HERE, it is Urgent")
+        
+        assert [m.keyword for m in matches] == ['click here', 'urgent']
+        assert matches[0].start == 7
+        assert matches[1].start == 25
+    
+    def test_prefix_keywords_all_reported(self):
+        """
+        Verify prefix-sharing keywords are each reported where they occur.
+        
+        Why this test: The trie-compiled pattern factors shared prefixes;
+        "payment" also contains "pay", as a substring check would find.
+        """
+        matcher = KeywordMatcher(['pay', 'payment'])
+        assert matcher.matched_keywords("Payment due, pay now") == {'payment', 'pay'}
+        assert [(m.keyword, m.start) for m in matcher.scan("payment")] == [('pay', 0), ('payment', 0)]
+    
+    def test_overlapping_keywords_match_substring_semantics(self):
+        """
+        Verify overlapping keywords are all found, as "kw in text" found them.
+        
+        Why this test: Non-overlapping matching lost "suspend" in
+        "dollarsuspend" (the shared "s"), silently lowering severity.
+        """
+        matcher = KeywordMatcher()
+        samples = ["Re: dollarsuspend", "secretransfer", "invoicebitcoinvoice",
+                   "clickheredownloadollars", "URGENTIMMEDIATEVERIFY", "winneredundant",
+                   "millionsuspendsecret", "refundollarsuspend"]
+        for text in samples:
+            expected = {kw for kw in SUSPICIOUS_KEYWORDS if kw in text.lower()}
+            assert matcher.matched_keywords(text) == expected, text
+            assert {m.keyword for m in matcher.scan_bytes(text.encode())} == expected, text
+        
+        features = compute_features("Re: dollarsuspend", "", "a@company.com", datetime(2025, 1, 6, 10))
+        assert features.high_urgency
+    
+    def test_empty_keyword_set_never_matches(self):
+        """
+        Verify an empty configuration degrades to no matches, not an error.
+        """
+        matcher = KeywordMatcher([])
+        assert matcher.scan("urgent") == []
+        assert matcher.search("urgent") == False
+    
+    def test_email_scan_separates_subject_matches(self):
+        """
+        Verify one scan distinguishes subject hits from body hits.
+        
+        Why this test: Severity escalation only considers the subject line,
+        so the single combined scan must keep the boundary exact.
+        """
+        scan = scan_email_text("Urgent request", "Account will be suspended")
+        
+        assert scan.keywords() == {'urgent', 'account', 'suspend'}
+        assert scan.subject_keywords() == {'urgent'}
+    
+    def test_features_memoized_per_email(self, sample_email_suspicious):
+        """
+        Verify rule evaluation happens once and is reused.
+        
+        Why this test: Agents call the predicates many times per email;
+        the cache must hand back the same record without rescanning.
+        """
+        with patch('agent.compute_features', wraps=compute_features) as spy:
+            first = sample_email_suspicious.features()
+            second = sample_email_suspicious.features()
+            assert sample_email_suspicious.is_suspicious() == True
+        
+        assert first is second
+        assert spy.call_count == 1
+        assert 'urgent' in first.keywords
+    
+    def test_features_invalidated_on_rule_change(self, sample_email_suspicious):
+        """
+        Verify installing a new RuleConfig refreshes cached features.
+        
+        Why this test: Stale cached verdicts after a rule change would
+        silently report results for the wrong policy.
+        """
+        assert sample_email_suspicious.is_external() == True
+        previous = set_rule_config(RuleConfig(internal_domains=('phishing-site.com',)))
+        try:
+            assert sample_email_suspicious.is_external() == False
+        finally:
+            set_rule_config(previous)
+        assert sample_email_suspicious.is_external() == True
+    
+    def test_severity_escalation_ignores_body_keywords(self):
+        """
+        Verify urgency words in the body alone do not escalate severity.
+        
+        Why this test: Regression guard - escalation was always subject-based;
+        the shared scan must not widen it to the body.
+        """
+        email = SimpleEmail(
+            id="body_only",
+            subject="Invoice attached",
+            sender="billing@vendor.com",
+            recipient="user@company.com",
+            date=datetime.now(),
+            content="This is urgent and critical",
+            file_path="test.txt"
+        )
+        agent = AnalysisAgent([email])
+        agent._keyword_analysis()
+        
+        assert len(agent.findings) == 1
+        assert agent.findings[0].severity == "Medium"
+
+
 # =============================================================================
 # DISCOVERY AGENT TESTS
 # =============================================================================
@@ -360,6 +509,393 @@ class TestDiscoveryAgent:
         assert len(emails) >= 1  # At least the good one
 
 
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_parallel_load_preserves_order_and_recovery(self, temp_email_directory, executor):
+        """
+        Verify pooled loading matches the sequential loader exactly.
+        
+        Why this test: Parallel parsing must not reorder evidence or lose
+        the recover-and-continue behaviour for damaged files.
+        """
+        for i in range(12):
+            path = os.path.join(temp_email_directory, f"email_{i:03d}.txt")
+            with open(path, 'w') as f:
+                f.write(f"ID: email_{i:03d}\nSubject: Urgent {i}\nFrom: a@b.com\n"
+                        f"To: c@company.com\nDate: 2025-01-10T10:00:00\nContent: Test\n")
+        with open(os.path.join(temp_email_directory, "email_005.txt"), 'wb') as f:
+            f.write(b"\xff\xfe not utf-8 \xff")  # Undecodable file
+        
+        sequential = DiscoveryAgent(temp_email_directory)
+        sequential.find_email_files()
+        expected = sequential.load_emails()
+        
+        parallel = DiscoveryAgent(temp_email_directory, workers=3, chunk_size=2, executor=executor)
+        parallel.find_email_files()
+        loaded = parallel.load_emails()
+        
+        assert [e.id for e in loaded] == [e.id for e in expected]
+        assert len(loaded) == 11
+        assert all(e.is_suspicious() for e in loaded)
+
+
+    def test_iter_email_files_is_lazy_and_filtered(self, temp_email_directory):
+        """
+        Verify streaming discovery yields only visible .txt files.
+        
+        Why this test: The scandir-based iterator replaces glob; it must
+        keep glob's filtering (extension, hidden files, no directories).
+        """
+        for name in ["a.txt", "b.txt", ".hidden.txt", "notes.md"]:
+            with open(os.path.join(temp_email_directory, name), 'w') as f:
+                f.write("ID: x\n")
+        os.mkdir(os.path.join(temp_email_directory, "dir.txt"))
+        
+        agent = DiscoveryAgent(temp_email_directory)
+        files = agent.iter_email_files()
+        
+        assert not isinstance(files, list)
+        assert sorted(os.path.basename(f) for f in files) == ["a.txt", "b.txt"]
+    
+    def test_streamed_analysis_matches_batch_analysis(self, temp_email_directory):
+        """
+        Verify analysing the email stream equals analysing the loaded list.
+        
+        Why this test: Streaming must be a memory optimisation only; the
+        statistics reported after a consumed stream must still be correct.
+        """
+        generator = EnhancedEmailGenerator()
+        for email in generator.generate_emails(count=10, suspicious_percentage=0.5):
+            shutil.copy(email.file_path, temp_email_directory)
+        
+        batch_discovery = DiscoveryAgent(temp_email_directory)
+        batch_discovery.find_email_files()
+        batch = AnalysisAgent(batch_discovery.load_emails())
+        batch.analyze_emails()
+        
+        stream = AnalysisAgent(DiscoveryAgent(temp_email_directory).iter_emails())
+        stream.analyze_emails()
+        
+        assert stream.get_statistics() == batch.get_statistics()
+        assert stream.get_statistics()['total_emails'] == 10
+
+
+    def test_recursive_discovery_of_eml_and_mbox(self, temp_email_directory):
+        """
+        Verify nested EML and MBOX evidence is discovered and parsed.
+        
+        Why this test: Custodian exports arrive as folder trees of standard
+        formats; each mbox message must carry its byte offset in the source.
+        """
+        nested = os.path.join(temp_email_directory, "custodian", "inbox")
+        os.makedirs(nested)
+        with open(os.path.join(nested, "single.eml"), 'wb') as f:
+            f.write(b"Message-ID: <eml-1@example.com>\r\n"
+                    b"From: \"Admin\" <admin@phishing-site.com>\r\n"
+                    b"To: victim@company.com\r\n"
+                    b"Subject: URGENT: verify account\r\n"
+                    b"Date: Fri, 10 Jan 2025 23:45:00 +0000\r\n\r\n"
+                    b"Click here now\r\n")
+        first = (b"From a@b.com Fri Jan 10 10:00:00 2025\n"
+                 b"Message-ID: <mbox-1@example.com>\nFrom: alice@company.com\n"
+                 b"To: bob@company.com\nSubject: Lunch\n\nSee you at noon\n\n")
+        second = (b"From c@d.com Fri Jan 10 11:00:00 2025\n"
+                  b"From: winner@lottery-scam.org\nTo: bob@company.com\n"
+                  b"Subject: Congratulations\n\n>From the lottery desk\n")
+        mbox_path = os.path.join(nested, "archive.mbox")
+        with open(mbox_path, 'wb') as f:
+            f.write(first + second)
+        
+        flat = DiscoveryAgent(temp_email_directory)
+        assert flat.find_email_files() == []
+        
+        agent = DiscoveryAgent(temp_email_directory, recursive=True)
+        assert len(agent.find_email_files()) == 2
+        emails = {e.subject: e for e in agent.load_emails()}
+        
+        assert emails["URGENT: verify account"].sender == "admin@phishing-site.com"
+        assert emails["URGENT: verify account"].is_after_hours() == True
+        assert emails["Lunch"].id == "mbox-1@example.com"
+        assert emails["Congratulations"].source_offset == len(first)
+        assert emails["Congratulations"].source_length == len(second)
+        assert emails["Congratulations"].content == "From the lottery desk"
+        assert emails["Congratulations"].id == f"archive.mbox@{len(first)}"
+
+    def test_mapped_mbox_reader_defers_body_decoding(self, temp_email_directory):
+        """
+        Verify large archives load with lazy bodies that match the streaming reader.
+        
+        Why this test: The memory-mapped path must give identical emails,
+        offsets and rule results while leaving bodies undecoded until read.
+        """
+        mbox_path = os.path.join(temp_email_directory, "archive.mbox")
+        with open(mbox_path, 'wb') as f:
+            f.write(b"From a@b.com Fri Jan 10 10:00:00 2025\n"
+                    b"From: winner@lottery-scam.org\nTo: bob@company.com\n"
+                    b"Subject: Prize\nDate: Fri, 10 Jan 2025 10:00:00 +0000\n\nClaim your BITCOIN\n>From the desk\n\n"
+                    b"From c@d.com Fri Jan 10 11:00:00 2025\n"
+                    b"From: it@company.com\nTo: bob@company.com\nSubject: Notice\n"
+                    b"Date: Fri, 10 Jan 2025 11:00:00 +0000\nContent-Transfer-Encoding: base64\n\nUGxlYXNlIHZlcmlmeQ==\n")
+        
+        streamed = list(DiscoveryAgent(temp_email_directory).iter_emails())
+        with patch('parsers.MMAP_THRESHOLD', 0):
+            mapped = list(DiscoveryAgent(temp_email_directory).iter_emails())
+        
+        assert [e.source_offset for e in mapped] == [e.source_offset for e in streamed]
+        assert [e.is_suspicious() for e in mapped] == [True, True]
+        assert '_content' in mapped[0].__dict__
+        assert not isinstance(mapped[0].__dict__['_content'], str)
+        assert mapped == streamed
+        assert mapped[0].content == "Claim your BITCOIN\nFrom the desk"
+        assert mapped[1].content == "Please verify"
+
+    def test_mapped_mbox_reread_after_append(self, temp_email_directory):
+        """
+        Verify a mapped archive is re-mapped when it grows.
+        
+        Why this test: Mappings are cached per file; a cache keyed on the
+        path alone kept serving the old, shorter mapping after an append.
+        """
+        mbox_path = os.path.join(temp_email_directory, "live.mbox")
+        message = ("From a@b.com Fri Jan 10 10:00:00 2025\nMessage-ID: <{0}@example.com>\n"
+                   "From: alice@company.com\nTo: bob@company.com\nSubject: {0}\n\nBody {0}\n\n")
+        with open(mbox_path, 'w') as f:
+            f.write(message.format("m1"))
+        with patch('parsers.MMAP_THRESHOLD', 0):
+            assert [e.id for e in DiscoveryAgent(temp_email_directory).iter_emails()] == ["m1@example.com"]
+            with open(mbox_path, 'a') as f:
+                f.write(message.format("m2"))
+            emails = list(DiscoveryAgent(temp_email_directory).iter_emails())
+        
+        assert [e.id for e in emails] == ["m1@example.com", "m2@example.com"]
+        assert emails[1].content == "Body m2"
+    
+    def test_manifest_reuses_unchanged_files(self, temp_email_directory):
+        """
+        Verify a second run only parses files that are new or modified.
+        
+        Why this test: Nightly re-scans of mostly unchanged case folders
+        must reuse cached emails and features yet return identical results.
+        """
+        generator = EnhancedEmailGenerator()
+        for email in generator.generate_emails(count=5, suspicious_percentage=0.4):
+            shutil.copy(email.file_path, temp_email_directory)
+        manifest_path = os.path.join(temp_email_directory, "state", "manifest.json")
+        
+        def run():
+            agent = DiscoveryAgent(temp_email_directory, manifest_path=manifest_path)
+            agent.find_email_files()
+            return agent, agent.load_emails()
+        
+        first_agent, first = run()
+        assert first_agent.manifest.misses == 5
+        
+        with patch('agent.iter_source_emails') as parse:
+            second_agent, second = run()
+        parse.assert_not_called()
+        assert second_agent.manifest.hits == 5
+        assert second == first
+        assert [e.features() for e in second] == [e.features() for e in first]
+        
+        changed = sorted(second_agent.discovered_files)[0]
+        with open(changed, 'a', encoding='utf-8') as f:
+            f.write("\nExtra: line\n")
+        os.utime(changed, ns=(0, 0))
+        third_agent, third = run()
+        assert (third_agent.manifest.hits, third_agent.manifest.misses) == (4, 1)
+        assert len(third) == 5
+    
+    def test_manifest_stores_locations_and_prunes_deleted_files(self, temp_email_directory):
+        """
+        Verify the manifest holds body locations, not bodies, and forgets deleted files.
+        
+        Why this test: Copying every body into the manifest duplicated the
+        evidence and made each save rewrite the corpus; entries for removed
+        files would otherwise accumulate forever.
+        """
+        generator = EnhancedEmailGenerator()
+        for email in generator.generate_emails(count=3, suspicious_percentage=0.4):
+            shutil.copy(email.file_path, temp_email_directory)
+        with open(os.path.join(temp_email_directory, "single.eml"), 'w') as f:
+            f.write("From: a@phish.example\nTo: b@company.com\nSubject: Hi\n\nVerify your account now\n")
+        manifest_path = os.path.join(temp_email_directory, "state", "manifest.json")
+        
+        first = DiscoveryAgent(temp_email_directory, manifest_path=manifest_path)
+        originals = sorted((e.id, e.content) for e in first.iter_emails())
+        with open(manifest_path, encoding='utf-8') as f:
+            saved = f.read()
+        assert "Verify your account now" not in saved
+        assert all(content not in saved for _, content in originals)
+        
+        with patch('agent.iter_source_emails') as parse:
+            reloaded = list(DiscoveryAgent(temp_email_directory, manifest_path=manifest_path).iter_emails())
+        parse.assert_not_called()
+        assert sorted((e.id, e.content) for e in reloaded) == originals
+        
+        os.remove(os.path.join(temp_email_directory, "single.eml"))
+        assert len(list(DiscoveryAgent(temp_email_directory, manifest_path=manifest_path).iter_emails())) == 3
+        with open(manifest_path, encoding='utf-8') as f:
+            assert "single.eml" not in f.read()
+
+    @pytest.mark.parametrize("force_polling", [False, True])
+    def test_watch_analyses_arriving_files_incrementally(self, temp_email_directory, force_polling):
+        """
+        Verify watch mode yields new files only and findings arrive per file.
+        
+        Why this test: Live monitoring must ignore files present at start,
+        parse each completed file once (inotify or polling fallback) and
+        alert on it without re-analysing earlier emails.
+        """
+        with open(os.path.join(temp_email_directory, "old.eml"), 'w') as f:
+            f.write("From: alice@company.com\nTo: bob@company.com\nSubject: Old\n\nHello\n")
+        
+        def drop():
+            time.sleep(0.2)
+            # Written under a hidden name, then renamed as mail delivery does
+            partial = os.path.join(temp_email_directory, ".new.eml")
+            with open(partial, 'w') as f:
+                f.write("From: admin@phishing-site.com\nTo: victim@company.com\n"
+                        "Subject: URGENT password reset\n"
+                        "Date: Fri, 10 Jan 2025 23:45:00 +0000\n\nVerify your account\n")
+            os.rename(partial, os.path.join(temp_email_directory, "new.eml"))
+        
+        analysis = AnalysisAgent([])
+        assert analysis.begin() == []
+        writer = threading.Thread(target=drop)
+        writer.start()
+        arrived = []
+        for file_path, emails in DiscoveryAgent(temp_email_directory).watch(
+                duration=5, poll_interval=0.05, force_polling=force_polling):
+            arrived.append(os.path.basename(file_path))
+            alerts = analysis.observe(emails)
+            break
+        writer.join()
+        
+        assert arrived == ["new.eml"]
+        assert {f.finding_type for f in alerts} >= {"Suspicious Keywords", "External Communication"}
+        assert analysis.get_statistics()['total_emails'] == 1
+        assert analysis.end() == alerts
+    
+    def test_watch_yields_only_new_messages_of_changed_files(self, temp_email_directory):
+        """
+        Verify an appended mbox and a rewritten file yield unseen messages only.
+        
+        Why this test: Re-parsing a whole changed file re-submitted every
+        earlier message to analysis, duplicating findings and inflating
+        volume and burst counts on every append.
+        """
+        mbox_path = os.path.join(temp_email_directory, "journal.mbox")
+        eml_path = os.path.join(temp_email_directory, "note.eml")
+        message = ("From a@b.com Fri Jan 10 10:00:00 2025\nMessage-ID: <{0}@example.com>\n"
+                   "From: alice@company.com\nTo: bob@company.com\nSubject: {0}\n\nBody {0}\n\n")
+        with open(mbox_path, 'w') as f:
+            f.write(message.format("m1") + message.format("m2"))
+        discovery = DiscoveryAgent(temp_email_directory)
+        analysis = AnalysisAgent([])
+        analysis.begin(retain=False)
+        seen = {}
+        
+        def ids(file_path):
+            emails = discovery._watched_file(file_path, seen)
+            if emails:
+                analysis.observe(emails)
+            return [email.id for email in emails] if emails is not None else None
+        
+        assert ids(mbox_path) == ["m1@example.com", "m2@example.com"]
+        with open(mbox_path, 'a') as f:
+            f.write(message.format("m3"))
+        assert ids(mbox_path) == ["m3@example.com"]
+        assert ids(mbox_path) is None  # Unchanged
+        
+        note = "Message-ID: <n1@example.com>\nFrom: carol@company.com\nSubject: {}\n\nHi\n"
+        with open(eml_path, 'w') as f:
+            f.write(note.format("Draft"))
+        assert ids(eml_path) == ["n1@example.com"]
+        with open(eml_path, 'w') as f:
+            f.write(note.format("Final version"))
+        assert ids(eml_path) == []
+        
+        assert analysis.get_statistics()['total_emails'] == 4
+        assert analysis.emails == []
+
+
+# =============================================================================
+# EMAIL STORE TESTS
+# =============================================================================
+
+class TestEmailStore:
+    """
+    Test suite for the columnar EmailStore.
+    
+    Why: The store replaces the list of SimpleEmail objects for large
+    evidence sets, so its views must be indistinguishable to the agents.
+    """
+    
+    def test_store_views_round_trip_emails(self, temp_email_directory):
+        """
+        Verify views rebuild every field, including lazily reloaded content.
+        
+        Why this test: Interning, date encoding and dropped bodies must not
+        change any value an agent or report reads.
+        """
+        generator = EnhancedEmailGenerator()
+        for email in generator.generate_emails(count=8, suspicious_percentage=0.5):
+            shutil.copy(email.file_path, temp_email_directory)
+        discovery = DiscoveryAgent(temp_email_directory)
+        discovery.find_email_files()
+        emails = discovery.load_emails()
+        aware = SimpleEmail("tz", "Hi", "a@x.org", "b@company.com",
+                            datetime.fromisoformat("2025-01-10T23:45:30.5+05:30"),
+                            "in memory only", "/nonexistent/tz.txt")
+        
+        store = EmailStore(emails + [aware])
+        
+        assert len(store) == 9
+        assert [view.to_email() for view in store] == emails + [aware]
+        assert store[-1].date.utcoffset() == aware.date.utcoffset()
+        assert store[0].content == emails[0].content
+        assert store.contents[0] is None
+        assert store.contents[-1] == "in memory only"
+        assert len(store.addresses) < 2 * len(store)
+    
+    def test_agents_accept_store(self, sample_email_list):
+        """
+        Verify analysis over a store matches analysis over the list.
+        
+        Why this test: Agents accept the store directly; findings and
+        statistics must not depend on the container.
+        """
+        list_agent = AnalysisAgent(sample_email_list)
+        store_agent = AnalysisAgent(EmailStore(sample_email_list))
+        
+        list_findings = list_agent.analyze_emails()
+        store_findings = store_agent.analyze_emails()
+        
+        assert ([(f.finding_type, f.email_id, f.severity) for f in store_findings]
+                == [(f.finding_type, f.email_id, f.severity) for f in list_findings])
+        assert store_agent.get_statistics() == list_agent.get_statistics()
+
+    def test_vectorized_histograms_match_email_dates(self, sample_email_list):
+        """
+        Verify hour and weekday histograms from list and store columns agree.
+        
+        Why this test: The store derives hours from epoch seconds and UTC
+        offsets arithmetically; it must match datetime.hour and weekday().
+        """
+        emails = sample_email_list + [SimpleEmail(
+            "tz", "Hi", "a@x.org", "b@company.com",
+            datetime.fromisoformat("2025-01-12T23:30:00-08:00"), "", "/test/tz.txt")]
+        expected_hours = np.bincount([e.date.hour for e in emails], minlength=24)
+        expected_cells = np.zeros((7, 24), dtype=int)
+        for email in emails:
+            expected_cells[email.date.weekday(), email.date.hour] += 1
+        
+        for source in (emails, EmailStore(emails)):
+            result = AnalysisAgent(source).get_histograms()
+            assert (result["hourly"] == expected_hours).all()
+            assert (result["weekday_hour"] == expected_cells).all()
+            assert result["weekday"].sum() == len(emails)
+
+
 # =============================================================================
 # ANALYSIS AGENT TESTS
 # =============================================================================
@@ -464,6 +1000,160 @@ class TestAnalysisAgent:
         volume_findings = [f for f in agent.findings if f.finding_type == "High Volume Sender"]
         assert len(volume_findings) > 0
     
+    def test_volume_analysis_keeps_threshold_findings_in_large_populations(self):
+        """
+        Verify every sender over the threshold is still reported once 20+
+        senders are tracked, with robust outliers escalated.
+        
+        Why this test: The population score must add information to the
+        High Volume Sender rule, not silently replace it; busy senders
+        stay reported, and only the bulk sender is raised to High.
+        """
+        emails = []
+        senders = [(f"user{n}@company.com", 6 + n % 3) for n in range(20)]
+        senders += [(f"quiet{n}@company.com", 3) for n in range(4)] + [("bulk@external.com", 60)]
+        for sender, count in senders:
+            emails += [SimpleEmail(id=f"{sender}_{i}", subject="Hi", sender=sender,
+                                   recipient="a@company.com", date=datetime(2025, 1, 10, 10),
+                                   content="", file_path="") for i in range(count)]
+        
+        findings = AnalysisAgent(emails, strategies=[VolumeStrategy()]).analyze_emails()
+        flagged = {f.key[0]: f.severity for f in findings}
+        
+        assert flagged == {**{f"user{n}@company.com": "Medium" for n in range(20)},
+                           "bulk@external.com": "High"}
+        assert all("robust z-score" in f.description for f in findings)
+    
+    def test_volume_spikes_survive_sketch_eviction(self):
+        """
+        Verify a sender's spike is found when many other senders and days
+        exceed the sketch capacity.
+        
+        Why this test: A shared (sender, day) sketch answered evicted days
+        with its minimum count, inflating every baseline until real spikes
+        disappeared; day histories must stay exact and memory bounded.
+        """
+        start = datetime(2025, 1, 1, 10)
+        emails = []
+        for day in range(10):
+            emails += [SimpleEmail(id=f"q{day}_{i}", subject="Hi", sender="quiet@company.com",
+                                   recipient="a@company.com", date=start + timedelta(days=day, seconds=i),
+                                   content="", file_path="") for i in range(40 if day == 9 else 1)]
+            emails += [SimpleEmail(id=f"o{n}_{day}_{i}", subject="Hi", sender=f"user{n}@corp.example",
+                                   recipient="a@company.com", date=start + timedelta(days=day, hours=1),
+                                   content="", file_path="") for n in range(100) for i in range(2)]
+        
+        strategy = VolumeStrategy(capacity=128)
+        findings = AnalysisAgent(emails, strategies=[strategy]).analyze_emails()
+        
+        assert [f.description for f in findings if "previous" in f.description] == [
+            "Sender sent 40 emails on 2025-01-10, against a median of 1 per day "
+            "over the previous 7 days (robust z-score 6.4)"]
+        assert len(strategy.senders) <= 128 and set(strategy.history) <= {
+            sender for sender, _, _ in strategy.senders.items()}
+    
+    def test_volume_analysis_flags_spike_against_own_baseline(self):
+        """
+        Verify a sender's day is judged against that sender's previous days.
+        
+        Why this test: A quiet account suddenly sending in bulk is the
+        signal; a sender that is always this busy is not, whatever order
+        the evidence files arrive in.
+        """
+        start = datetime(2025, 1, 1, 10)
+        
+        def mails(sender, day, count):
+            return [SimpleEmail(id=f"{sender}_{day}_{i}", subject="Hi", sender=sender,
+                                recipient="a@company.com", date=start + timedelta(days=day, minutes=i),
+                                content="", file_path="") for i in range(count)]
+        emails = []
+        for day in range(10):
+            emails += mails("quiet@company.com", day, 1) + mails("steady@company.com", day, 8)
+        emails += mails("quiet@company.com", 10, 9) + mails("steady@company.com", 10, 8)
+        emails.reverse()
+        
+        strategy = VolumeStrategy(min_population=1000)
+        findings = AnalysisAgent(emails, strategies=[strategy]).analyze_emails()
+        spikes = [f.description for f in findings if "previous" in f.description]
+        
+        assert spikes == ["Sender sent 9 emails on 2025-01-11, against a median of 1 per day "
+                          "over the previous 7 days (robust z-score 6.4)"]
+    
+    def test_merged_sender_sketches_keep_volume_bounds(self):
+        """
+        Verify Space-Saving sketches from separate shards merge correctly.
+        
+        Why this test: Sharded volume analysis is only as good as the merged
+        sketch - exact when senders fit, never under- or over-reporting
+        beyond its bounds when they do not.
+        """
+        shards = [[f"s{i % 7}@x.org" for i in range(60)] + ["heavy@x.org"] * 25,
+                  [f"t{i % 30}@x.org" for i in range(90)] + ["heavy@x.org"] * 40]
+        truth = Counter(sender for shard in shards for sender in shard)
+        
+        for capacity, exact in ((64, True), (8, False)):
+            sketches = []
+            for shard in shards:
+                sketch = SpaceSaving(capacity)
+                for sender in shard:
+                    sketch.add(sender)
+                sketches.append(sketch)
+            merged = sketches[0]
+            merged.merge(sketches[1])
+            
+            assert merged.exact == exact and len(merged) <= capacity
+            assert merged.total == sum(truth.values())
+            assert merged.items()[0][0] == "heavy@x.org"
+            for sender, count, error in merged.items():
+                assert count - error <= truth[sender] <= count
+            if exact:
+                assert {sender: count for sender, count, _ in merged.items()} == truth
+    
+    def test_burst_analysis_flags_campaign_spike(self):
+        """
+        Verify a tight spike is flagged while steady traffic is not.
+        
+        Why this test: Campaigns are defined by rate, not totals; a sender
+        with more emails spread over weeks must not outrank a burst.
+        """
+        start = datetime(2025, 1, 1, 9, 0)
+        steady = [SimpleEmail(id=f"st_{i}", subject="Report", sender="ops@company.com",
+                              recipient="a@company.com", date=start + timedelta(hours=6 * i),
+                              content="", file_path="") for i in range(120)]
+        spike = [SimpleEmail(id=f"sp_{i}", subject="Invoice", sender=f"billing{i % 3}@phish.example",
+                             recipient="a@company.com", date=start + timedelta(days=10, seconds=20 * i),
+                             content="", file_path="") for i in range(12)]
+        
+        findings = AnalysisAgent(steady + spike, strategies=[BurstStrategy()]).analyze_emails()
+        
+        assert [(f.severity, f.description) for f in findings] == [
+            ("High", "Domain phish.example sent 12 emails within 5 minutes from 2025-01-11 09:00")]
+    
+    def test_cross_email_findings_keep_key_as_counts_grow(self):
+        """
+        Verify re-evaluated volume findings keep one key per sender.
+        
+        Why this test: Watch mode alerts once per finding key; descriptions
+        carry counts that change on every evaluation and do not name the
+        sender, so they cannot identify a finding.
+        """
+        def emails(sender, start, count):
+            return [SimpleEmail(id=f"{sender}_{start + i}", subject="Test", sender=sender,
+                                recipient="victim@company.com", date=datetime(2025, 1, 6, 12),
+                                content="", file_path="") for i in range(count)]
+        
+        agent = AnalysisAgent([], strategies=[VolumeStrategy()])
+        agent.begin(retain=False)
+        agent.observe(emails("a@spam.example", 0, 6) + emails("b@spam.example", 0, 6))
+        first = agent.aggregates()
+        agent.observe(emails("a@spam.example", 6, 2))
+        second = agent.aggregates()
+        
+        assert [f.key for f in first] == [("a@spam.example", "dataset"), ("b@spam.example", "dataset")]
+        assert [f.key for f in second] == [f.key for f in first]
+        assert second[0].description != first[0].description
+        assert agent.emails == [] and agent.get_statistics()['total_emails'] == 14
+    
     def test_analyze_emails_integration(self, sample_email_list):
         """
         Integration test: verify all analysis strategies execute.
@@ -480,6 +1170,137 @@ class TestAnalysisAgent:
         assert isinstance(findings[0], Finding)
         assert findings[0].severity in ["Low", "Medium", "High"]
     
+    def test_fused_mode_matches_sequential_mode(self, sample_email_list):
+        """
+        Verify the single-pass engine reproduces per-strategy passes exactly.
+        
+        Why this test: Fused execution is an optimisation only; findings
+        (including their order) and statistics must not change.
+        """
+        fused = AnalysisAgent(sample_email_list)
+        sequential = AnalysisAgent(sample_email_list)
+        fused_findings = fused.analyze_emails(fused=True)
+        sequential_findings = sequential.analyze_emails(fused=False)
+        
+        assert ([(f.finding_type, f.email_id, f.severity) for f in fused_findings] ==
+                [(f.finding_type, f.email_id, f.severity) for f in sequential_findings])
+        assert fused.get_statistics() == sequential.get_statistics()
+    
+    def test_registered_strategy_runs_in_fused_pass(self, sample_email_list):
+        """
+        Verify custom strategies plug in and see each email exactly once.
+        
+        Why this test: Extensibility contract - new detection methods must
+        join the shared pass without changes to the orchestrator.
+        """
+        class CountingStrategy(AnalysisStrategy):
+            name = "counting"
+            
+            def reset(self):
+                self.seen = 0
+            
+            def observe(self, email, features, findings):
+                self.seen += 1
+            
+            def finalize(self, findings):
+                findings.append(Finding("Counted", f"{self.seen} emails", "multiple",
+                                        "Low", datetime.now()))
+        
+        strategy = CountingStrategy()
+        agent = AnalysisAgent(sample_email_list)
+        agent.register_strategy(strategy)
+        findings = agent.analyze_emails()
+        
+        assert strategy.seen == len(sample_email_list)
+        assert findings[-1].finding_type == "Counted"
+    
+    def test_aggregated_findings_group_and_expand(self, sample_email_suspicious):
+        """
+        Verify aggregated mode groups per-email hits and expands losslessly.
+        
+        Why this test: Groups replace one Finding per email per rule; counts
+        must add up and expand() must rebuild exactly the detailed findings.
+        """
+        emails = [SimpleEmail(id=f"ph_{i}", subject=sample_email_suspicious.subject,
+                              sender=f"user{i % 2}@phishing-site.com", recipient="victim@company.com",
+                              date=sample_email_suspicious.date, content="", file_path="")
+                  for i in range(10)]
+        detailed = AnalysisAgent(emails).analyze_emails()
+        agent = AnalysisAgent(emails, aggregate=True)
+        groups = agent.analyze_emails()
+        
+        # Keyword and timing rules group per sender, external per domain
+        assert [(g.finding_type, g.key, g.count) for g in groups[:5]] == [
+            ("Suspicious Keywords", "user0@phishing-site.com", 5),
+            ("Suspicious Keywords", "user1@phishing-site.com", 5),
+            ("After Hours Communication", "user0@phishing-site.com", 5),
+            ("After Hours Communication", "user1@phishing-site.com", 5),
+            ("External Communication", "phishing-site.com", 10)]
+        external = agent.expand(groups[4])
+        assert ([(f.description, f.email_id) for f in external] ==
+                [(f.description, f.email_id) for f in detailed if f.finding_type == "External Communication"])
+    
+    def test_findings_share_run_timestamp_and_format_lazily(self, sample_email_list):
+        """
+        Verify compact findings keep the Finding API with deferred formatting.
+        
+        Why this test: Descriptions are built only when read and timestamps
+        come from the run, yet reports and pickled copies must see the same
+        values the eager dataclass produced.
+        """
+        import pickle
+        findings = AnalysisAgent(sample_email_list).analyze_emails()
+        keyword = next(f for f in findings if f.finding_type == "Suspicious Keywords")
+        
+        assert not hasattr(keyword, '__dict__')
+        assert keyword._description is None and keyword.rule == "keyword"
+        assert keyword.description == "Email contains suspicious keywords: URGENT: Account verification required"
+        assert len({f.timestamp for f in findings}) == 1
+        assert pickle.loads(pickle.dumps(keyword)) == keyword
+    
+    def test_findings_collection_indexes_by_severity(self, sample_email_list):
+        """
+        Verify findings are bucketed and counted as analysis appends them.
+        
+        Why this test: Reports rely on by_severity() matching a stable
+        severity sort, and statistics on the incremental counts.
+        """
+        agent = AnalysisAgent(sample_email_list)
+        findings = agent.analyze_emails()
+        rank = {'High': 3, 'Medium': 2, 'Low': 1}
+        
+        assert list(findings.by_severity()) == sorted(findings, key=lambda f: rank[f.severity], reverse=True)
+        assert findings.severity_counts() == {
+            severity: sum(f.severity == severity for f in findings) for severity in ("High", "Medium", "Low")}
+        assert agent.get_statistics()['high_severity_findings'] == findings.count_severity("High")
+        assert ReportAgent(sample_email_list, list(findings))._statistics() == agent.get_statistics()
+    
+    def test_findings_collection_behaves_as_list(self, sample_email_list):
+        """
+        Verify list operations keep list semantics and the index in step.
+        
+        Why this test: Callers treat analyze_emails() results as a list;
+        count(x), +, insert, remove and sort must work as for a list.
+        """
+        import pickle
+        findings = AnalysisAgent(sample_email_list).analyze_emails()
+        first = findings[0]
+        
+        assert isinstance(findings, list)
+        assert findings.count(first) == 1
+        assert findings + [first] == list(findings) + [first]
+        findings.remove(first)
+        findings.insert(0, first)
+        findings.sort(key=lambda f: f.severity)
+        del findings[0]
+        
+        def counted():
+            return {s: sum(f.severity == s for f in findings) for s in ("High", "Medium", "Low")}
+        assert findings.severity_counts() == counted()
+        assert sorted(map(id, findings.by_severity())) == sorted(map(id, findings))
+        copy = pickle.loads(pickle.dumps(findings))
+        assert copy == findings and copy.severity_counts() == findings.severity_counts()
+    
     def test_get_statistics(self, sample_email_list):
         """
         Verify statistics calculation returns correct metrics.
@@ -549,6 +1370,117 @@ class TestDashboardAgent:
         except Exception as e:
             pytest.fail(f"Dashboard failed on empty data: {e}")
 
+    @patch('matplotlib.pyplot.savefig')
+    @patch('matplotlib.pyplot.close')
+    def test_dashboard_renders_from_saved_summary(self, mock_close, mock_savefig,
+                                                  sample_email_list, temp_email_directory):
+        """
+        Verify chart inputs come from one pass and survive a JSON round trip.
+        
+        Why this test: Dashboards must be re-renderable from the saved
+        summary alone, without touching the raw emails again.
+        """
+        findings = AnalysisAgent(sample_email_list).analyze_emails()
+        passes = []
+        
+        def emails():
+            passes.append(1)
+            yield from sample_email_list
+        
+        summary = DashboardAgent(emails(), findings).summary
+        path = os.path.join(temp_email_directory, "summary.json")
+        summary.save(path)
+        
+        agent = DashboardAgent.from_summary(DashboardSummary.load(path))
+        agent.generate_dashboard()
+        
+        assert len(passes) == 1
+        assert agent.summary == summary
+        assert summary.total_findings == len(findings)
+        assert sum(summary.hour_counts) == len(sample_email_list)
+        assert mock_savefig.call_count == 8
+    
+    @patch.dict('charts.WORDCLOUD_OPTIONS', width=300, height=150)
+    def test_summary_counts_come_from_analysis_arrays(self, sample_email_list):
+        """
+        Verify the summary reuses the analysis columns for its counters.
+        
+        Why this test: Hours, weekdays and flag totals are already held as
+        arrays after analysis; counting them again per email doubled the
+        dashboard's aggregation work.
+        """
+        agent = AnalysisAgent(sample_email_list)
+        findings = agent.analyze_emails()
+        recounted = DashboardSummary.from_data(sample_email_list, findings)
+        with patch.object(SimpleEmail, 'features', side_effect=AssertionError("recounted")):
+            summary = DashboardSummary.from_data(sample_email_list, findings,
+                                                 agent.get_email_arrays())
+        
+        assert summary == recounted
+        assert summary.hour_counts == agent.get_histograms()['hourly'].tolist()
+        assert summary.suspicious_emails == agent.get_statistics()['suspicious_emails']
+    
+    def test_render_cache_rerenders_only_changed_charts(self, sample_email_list, temp_email_directory):
+        """
+        Verify unchanged charts are skipped and restyling invalidates them.
+        
+        Why this test: Re-running a case after a small change should only
+        redraw charts whose aggregated inputs changed.
+        """
+        cache_dir = os.path.join(temp_email_directory, "cache")
+        
+        def run(emails, findings, profile="preview"):
+            agent = DashboardAgent(emails, findings, cache_dir=cache_dir, profile=profile)
+            agent.output_dir = temp_email_directory
+            agent.generate_dashboard()
+            return agent
+        
+        findings = AnalysisAgent(sample_email_list).analyze_emails()
+        assert len(run(sample_email_list, findings).rendered) == 8
+        assert len(run(sample_email_list, findings).reused) == 8
+        
+        changed = run(sample_email_list, findings[:-1])
+        assert sorted(os.path.basename(p) for p in changed.rendered) == [
+            "severity_distribution.png", "summary_chart.png"]
+        
+        restyled = charts.PREVIEW._replace(dpi=60)
+        assert len(run(sample_email_list, findings[:-1], restyled).rendered) == 8
+    
+    def test_parallel_dashboard_renders_every_chart(self, sample_email_list, temp_email_directory):
+        """
+        Verify the process-pool mode writes all eight charts.
+        
+        Why this test: Workers render from pre-aggregated data only; every
+        renderer must accept what its _generate_* method hands over.
+        """
+        findings = AnalysisAgent(sample_email_list).analyze_emails()
+        agent = DashboardAgent(sample_email_list, findings, workers=4, profile="preview")
+        agent.output_dir = temp_email_directory
+        agent.generate_dashboard()
+        
+        assert sorted(os.listdir(temp_email_directory)) == sorted([
+            "summary_chart.png", "email_distribution_pie.png", "hourly_distribution.png",
+            "wordcloud.png", "timeline.png", "activity_heatmap.png",
+            "network_analysis.png", "severity_distribution.png"])
+    
+    @patch('matplotlib.pyplot.savefig')
+    @patch('matplotlib.pyplot.close')
+    def test_preview_profile_lowers_output_quality(self, mock_close, mock_savefig, sample_email_list):
+        """
+        Verify the preview profile saves at low dpi without a tight bbox.
+        
+        Why this test: Preview output must differ only in quality settings,
+        and unknown profile names must fail fast rather than fall back.
+        """
+        agent = DashboardAgent(sample_email_list, [], profile="preview")
+        agent._generate_summary_chart()
+        
+        assert mock_savefig.call_args.kwargs["dpi"] == charts.PREVIEW.dpi
+        assert mock_savefig.call_args.kwargs["bbox_inches"] is None
+        assert charts.PUBLICATION.dpi == 300
+        with pytest.raises(ValueError):
+            DashboardAgent(sample_email_list, [], profile="poster")
+
 
 # =============================================================================
 # REPORT AGENT TESTS
@@ -594,6 +1526,51 @@ class TestReportAgent:
             assert "EXECUTIVE SUMMARY" in content
             assert "DETAILED FINDINGS" in content
     
+    def test_text_report_streams_sorted_and_compressed(self, sample_email_list, temp_email_directory):
+        """
+        Verify the streamed report lists findings most severe first and
+        that the gzip variant holds the same findings.
+        
+        Why this test: The report is written in chunks rather than built in
+        memory; ordering and content must match the original layout.
+        """
+        findings = [Finding(finding_type=f"Type {i}", description="d", email_id=f"e{i}",
+                            severity=severity, timestamp=datetime(2024, 1, 1))
+                    for i, severity in enumerate(["Low", "High", "Medium", "High"] * 700)]
+        
+        def finding_ids(agent, opener):
+            agent.output_dir = temp_email_directory
+            agent._generate_text_report()
+            with opener(agent.text_report_path, 'rt', encoding='utf-8') as f:
+                return [line.split(": ")[1] for line in f if line.startswith("Email ID:")]
+        
+        plain = finding_ids(ReportAgent(sample_email_list, findings), open)
+        compressed = finding_ids(ReportAgent(sample_email_list, findings, compress=True), gzip.open)
+        
+        expected = sorted(findings, key=lambda x: {'High': 3, 'Medium': 2, 'Low': 1}[x.severity], reverse=True)
+        assert plain == [f"{finding.email_id}\n" for finding in expected]
+        assert compressed == plain
+    
+    def test_reports_share_statistics_from_analysis_arrays(self, sample_email_list, temp_email_directory):
+        """
+        Verify both report formats use one statistics result from the
+        analysis columns.
+        
+        Why this test: Each format used to re-run analysis statistics with
+        a full pass over the emails; the columns already hold every count.
+        """
+        analysis = AnalysisAgent(sample_email_list)
+        findings = analysis.analyze_emails()
+        agent = ReportAgent(sample_email_list, findings, arrays=analysis.get_email_arrays())
+        agent.output_dir = temp_email_directory
+        
+        with patch.object(SimpleEmail, 'features', side_effect=AssertionError("recounted")), \
+                patch('agent.summarize', wraps=summarize) as computed:
+            agent.generate_comprehensive_report()
+        
+        assert computed.call_count == 1
+        assert agent._statistics() == analysis.get_statistics()
+    
     def test_generate_html_report(self, sample_email_list, temp_email_directory):
         """
         Verify HTML report generation creates valid HTML file.
@@ -615,6 +1592,86 @@ class TestReportAgent:
             assert "<!DOCTYPE html>" in content
             assert "<html" in content
             assert "</html>" in content
+    
+    def test_html_template_compiled_once_and_escaped(self, sample_email_list, temp_email_directory):
+        """
+        Verify HTML reports reuse one compiled template and escape findings.
+        
+        Why this test: Batch runs render many reports; recompiling per report
+        was the dominant cost. Finding text quotes attacker-controlled email
+        fields and must not inject markup.
+        """
+        findings = [Finding(finding_type="Keyword", description="<script>alert(1)</script>",
+                            email_id="e1", severity="High", timestamp=datetime(2024, 1, 1))]
+        template = reports.template_environment().get_template("forensics_report.html")
+        
+        agent = ReportAgent(sample_email_list, findings)
+        agent.output_dir = temp_email_directory
+        agent._generate_html_report()
+        
+        with open(os.path.join(temp_email_directory, "forensics_report.html"), encoding='utf-8') as f:
+            content = f.read()
+        assert "&lt;script&gt;" in content and "<script>" not in content
+        assert reports.template_environment().get_template("forensics_report.html") is template
+    
+    def test_html_report_paginates_large_cases(self, sample_email_list, temp_email_directory):
+        """
+        Verify large cases produce grouped counts plus linked finding pages.
+        
+        Why this test: The main report must stay small however many findings
+        exist, while every finding remains reachable, most severe first.
+        """
+        findings = [Finding(finding_type=f"Type {i % 2}", description="d", email_id=f"e{i}",
+                            severity=severity, timestamp=datetime(2024, 1, 1))
+                    for i, severity in enumerate(["Low", "High", "Medium", "High"] * 2)]
+        agent = ReportAgent(sample_email_list, findings, page_size=3)
+        agent.output_dir = temp_email_directory
+        agent._generate_html_report()
+        
+        with open(os.path.join(temp_email_directory, "forensics_report.html"), encoding='utf-8') as f:
+            index = f.read()
+        page_dir = os.path.join(temp_email_directory, "findings")
+        pages = sorted(os.listdir(page_dir))
+        with open(os.path.join(page_dir, pages[0]), encoding='utf-8') as f:
+            first_page = f.read()
+        
+        assert pages == ["page_00001.html", "page_00002.html", "page_00003.html"]
+        assert 'class="finding ' not in index
+        assert 'href="findings/page_00003.html"' in index
+        assert "<td>Type 1</td><td>High</td><td class=\"count\">4</td>" in index
+        assert first_page.count('class="finding high"') == 3
+        assert 'href="page_00002.html"' in first_page
+    
+    def test_inline_and_paginated_reports_list_findings_in_same_order(self, sample_email_list,
+                                                                     temp_email_directory):
+        """
+        Verify inline HTML findings follow the paginated (severity) order.
+        
+        Why this test: The same case must list its findings identically
+        whether or not it is large enough to be paginated.
+        """
+        findings = [Finding(finding_type="Type", description="d", email_id=f"e{i}",
+                            severity=severity, timestamp=datetime(2024, 1, 1))
+                    for i, severity in enumerate(["Low", "High", "Medium", "High"])]
+        
+        def listed(page_size):
+            agent = ReportAgent(sample_email_list, findings, page_size=page_size)
+            agent.output_dir = temp_email_directory
+            agent._generate_html_report()
+            paths = [os.path.join(temp_email_directory, "forensics_report.html")]
+            page_dir = os.path.join(temp_email_directory, "findings")
+            if os.path.isdir(page_dir):
+                paths += [os.path.join(page_dir, name) for name in sorted(os.listdir(page_dir))]
+            html = ""
+            for path in paths:
+                with open(path, encoding='utf-8') as f:
+                    html += f.read()
+            return re.findall(r"<strong>Email:</strong> (\w+)</p>", html)
+        
+        inline = listed(page_size=100)
+        paginated = listed(page_size=2)
+        
+        assert inline == paginated == ["e1", "e3", "e2", "e0"]
 
 
 # =============================================================================
@@ -716,6 +1773,113 @@ class TestSystemIntegration:
         assert len(findings) > 0
         assert stats['total_emails'] == len(loaded_emails)
 
+    def test_streamed_analysis_matches_sequential_run(self, temp_email_directory):
+        """
+        Verify discovery streamed through the bounded queue analyses every email.
+        
+        Why this test: Batching and backpressure (one-batch queue here) must
+        not drop or duplicate emails, so findings and statistics equal
+        those of the sequential pipeline.
+        """
+        generator = EnhancedEmailGenerator()
+        for email in generator.generate_emails(count=12, suspicious_percentage=0.5):
+            shutil.copy(email.file_path, temp_email_directory)
+        
+        sequential = AnalysisAgent(list(DiscoveryAgent(temp_email_directory).iter_emails()))
+        expected = sequential.analyze_emails()
+        
+        analysis = AnalysisAgent([])
+        timings = pipeline.StageTimings()
+        findings = asyncio.run(pipeline.stream_analysis(
+            DiscoveryAgent(temp_email_directory), analysis, timings, batch_size=5, queue_batches=1))
+        
+        # Detection order differs (per batch rather than per strategy); content must not
+        assert sorted((f.finding_type, f.email_id, f.description) for f in findings) == \
+            sorted((f.finding_type, f.email_id, f.description) for f in expected)
+        assert analysis.get_statistics() == sequential.get_statistics()
+        assert set(timings.stages) == {"discovery", "analysis"}
+
+    def test_sharded_analysis_matches_single_process(self, temp_email_directory):
+        """
+        Verify map/reduce over shards reproduces the single-process analysis.
+        
+        Why this test: Volume and burst rules need every email; after
+        merging shard partials their findings, like the per-email findings
+        and statistics, must not depend on how files were split.
+        """
+        generator = EnhancedEmailGenerator()
+        for email in generator.generate_emails(count=10, suspicious_percentage=0.3):
+            shutil.copy(email.file_path, temp_email_directory)
+        for i in range(12):
+            with open(os.path.join(temp_email_directory, f"wave_{i}.eml"), 'w') as f:
+                f.write(f"From: billing@phish.example\nTo: victim@company.com\nSubject: Invoice {i}\n"
+                        f"Date: Sat, 11 Jan 2025 09:00:{i * 4:02d} +0000\n\nPlease pay\n")
+        
+        single = AnalysisAgent(list(DiscoveryAgent(temp_email_directory).iter_emails()))
+        expected = single.analyze_emails()
+        merged = shards.run_sharded(temp_email_directory, shards=3)
+        
+        def described(findings):
+            return sorted((f.finding_type, f.severity, f.email_id, f.description) for f in findings)
+        
+        assert {"High Volume Sender", "Volume Burst"} <= {f.finding_type for f in expected}
+        assert described(merged.findings) == described(expected)
+        assert merged.get_statistics() == single.get_statistics()
+        assert np.array_equal(merged.get_histograms()['weekday_hour'], single.get_histograms()['weekday_hour'])
+
+    def test_output_stages_run_concurrently(self):
+        """
+        Verify dashboard, reports and documentation overlap.
+        
+        Why this test: The output phase should take about as long as its
+        slowest stage, not the sum of all three.
+        """
+        def slow(*args):
+            time.sleep(0.3)
+            return {'class_diagram_path': 'x'}
+        
+        def render(*args):
+            time.sleep(0.3)
+            return ["chart.png"], []
+        
+        timings = pipeline.StageTimings()
+        dashboard_agent = DashboardAgent([], [])
+        # A thread stands in for the render process, so the patch applies
+        with patch('pipeline._render_dashboard', render), \
+                patch.object(ReportAgent, 'generate_comprehensive_report', slow), \
+                patch('pipeline.generate_uml_documentation', slow), \
+                ThreadPoolExecutor(max_workers=1) as renderer:
+            start = time.perf_counter()
+            uml_paths = asyncio.run(pipeline.run_output_stages(
+                dashboard_agent, ReportAgent([], []), timings, renderer))
+            elapsed = time.perf_counter() - start
+        
+        assert uml_paths == {'class_diagram_path': 'x'}
+        assert dashboard_agent.rendered == ["chart.png"]
+        assert set(timings.stages) == {"visualization", "reporting", "documentation"}
+        assert elapsed < 0.8
+    
+    def test_dashboard_stage_renders_in_spawned_process(self, sample_email_list, temp_email_directory,
+                                                        monkeypatch):
+        """
+        Verify the output phase draws the dashboard outside this process.
+        
+        Why this test: pyplot is not thread-safe, so the pipeline must hand
+        the summary to a render process instead of drawing on a thread.
+        """
+        monkeypatch.chdir(temp_email_directory)
+        findings = AnalysisAgent(sample_email_list).analyze_emails()
+        dashboard_agent = DashboardAgent(sample_email_list, findings, profile="preview")
+        with patch.object(ReportAgent, 'generate_comprehensive_report'), \
+                patch('pipeline.generate_uml_documentation'), \
+                patch('matplotlib.pyplot.savefig') as savefig:
+            asyncio.run(pipeline.run_output_stages(dashboard_agent, ReportAgent([], []),
+                                                   pipeline.StageTimings()))
+        
+        assert not savefig.called
+        assert len(dashboard_agent.rendered) == 8
+        assert all(os.path.isfile(path) for path in dashboard_agent.rendered)
+
 
 # =============================================================================
 # TEST EXECUTION SUMMARY